@@ -1,11 +1,34 @@
 import time
+import json
+import hashlib
+import queue
+import random
+import sqlite3
+import threading
 import requests
 import smtplib
 import ssl
 import os
+import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from bs4 import BeautifulSoup
+
+import CelebCoinSentry_Http as http
+import CelebCoinSentry_Metrics as metrics
+import CelebCoinSentry_Profiler as profiling
+from CelebCoinSentry_Extract import extract_recently_added_rows
+from CelebCoinSentry_Matcher import (
+    MatcherNames,
+    build_matcher,
+    build_trigram_index,
+    find_fuzzy_matches,
+    find_matches,
+    load_or_build_matcher,
+    matched_names,
+)
 
 # -------------------------------------------------
 # CelebCoinSentry Metadata
@@ -28,8 +51,37 @@ CHECK_INTERVAL = 3600  # e.g. 1 hour
 #    If False, fallback to the official /markets API for top coins.
 SCRAPE_RECENTLY_ADDED = True
 
-# 4) Time in seconds to wait between requests to reduce rate-limit issues
-TIME_BETWEEN_REQUESTS = 60
+#    If True, ignore SCRAPE_RECENTLY_ADDED and instead diff the complete
+#    /coins/list against the previous snapshot: every new ID is checked,
+#    for one request per cycle.
+DIFF_COINS_LIST = False
+
+#    Or list several sources to run concurrently: their coins are merged,
+#    deduplicated on coin ID, and matched as they arrive. Choices:
+#    "recently_added", "markets", "coins_list", "feed". None = use the
+#    flags above.
+COIN_SOURCES = None  # e.g. ["recently_added", "markets"]
+
+#    Local coin feed for the "feed" source (testing / replay): JSONL, one
+#    coin per line (tailed between cycles), or a .json list.
+COIN_FEED_FILE = "CelebCoinSentry_coin_feed.jsonl"
+
+# 4) CoinGecko request budget, enforced by a shared token bucket.
+#    Every CoinGecko call (lists, HTML page, descriptions) draws one token.
+COINGECKO_CALLS_PER_MINUTE = 10
+COINGECKO_BURST = 10  # max tokens that can accumulate while idle
+
+#    Max description lookups in flight at once (still bounded by the budget).
+MAX_CONCURRENT_REQUESTS = 4
+
+#    How long (seconds) a cycle may spend on description lookups. Suspects
+#    beyond the budget for this window are persisted and retried next cycle.
+DESCRIPTION_FETCH_WINDOW = 120
+
+#    On HTTP 429/503, honor Retry-After if present, else back off
+#    exponentially from RATE_LIMIT_BACKOFF seconds, up to MAX_RETRIES times.
+RATE_LIMIT_BACKOFF = 30
+MAX_RETRIES = 3
 
 # 5) Whether to use a custom “User-Agent” header 
 #    (helps avoid 403 errors when scraping HTML).
@@ -38,44 +90,151 @@ USE_CUSTOM_USER_AGENT = True
 # User-Agent to use if USE_CUSTOM_USER_AGENT is True
 CUSTOM_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
 
+# HTML extraction backend: "auto", "lxml", "strainer" or "bs4"
+# (see CelebCoinSentry_Extract.py; "bs4" is the original full parse)
+HTML_PARSER_BACKEND = "auto"
+
 # 3a) CoinGecko "Recently Added" page (HTML)
 COINGECKO_RECENTLY_ADDED_URL = "https://www.coingecko.com/en/coins/recently_added"
 
+#     Validators, content hash and recently seen slugs for that page, so
+#     unchanged pages are skipped (304 or same hash) and parsing stops at
+#     the first row we already processed.
+RECENTLY_ADDED_STATE_FILE = "CelebCoinSentry_recently_added_state.json"
+RECENTLY_ADDED_SEEN_LIMIT = 1000  # slugs remembered across cycles
+
 # 3b) If not scraping HTML, fetch from official API (top coins).
 COINGECKO_API_URL = (
     "https://api.coingecko.com/api/v3/coins/markets"
     "?vs_currency=usd"
     "&order=market_cap_desc"
-    "&per_page=10"
-    "&page=1"
     "&sparkline=false"
     "&locale=en"
     # Removed "&category=new" to avoid 404
 )
 
+#     Deep scan: MARKETS_SCAN_PAGES pages of MARKETS_PER_PAGE coins each.
+#     Page k+1 downloads while page k is matched; the scan stops early at
+#     a page holding only coins already alerted or already cleared.
+MARKETS_PER_PAGE = 250
+MARKETS_SCAN_PAGES = 4
+
+#     Coins the sources may have waiting for the matcher. A source that gets
+#     this far ahead blocks until matching catches up, so memory stays at
+#     about one page however many pages or sources are scanned.
+SOURCE_QUEUE_SIZE = MARKETS_PER_PAGE
+
 # Email settings (only relevant if ALERT_METHOD includes "email")
 EMAIL_SENDER = "youremail@example.com"
 EMAIL_PASSWORD = "YOUR_EMAIL_PASSWORD_OR_APP_PASSWORD"
 EMAIL_SMTP_SERVER = "smtp.gmail.com"
 EMAIL_SMTP_PORT = 587
 EMAIL_RECIPIENTS = ["recipient1@example.com"]
+EMAIL_USE_STARTTLS = True  # set False for a local SMTP stub
 
 # Discord settings (only relevant if ALERT_METHOD includes "discord")
 DISCORD_WEBHOOK_URL = "https://discord.com/api/webhooks/YOUR_ID/YOUR_TOKEN"
 DISCORD_BOT_NAME = "CelebCoinSentry Bot"
 DISCORD_BOT_ICON = ""  # or URL to an image
+DISCORD_MAX_EMBEDS = 10  # webhook limit per message
+DISCORD_MAX_EMBED_CHARS = 6000  # webhook limit on total embed text per message
+
+# Alert delivery runs on a background queue so detection never waits on it.
+ALERT_MAX_RETRIES = 3
+ALERT_RETRY_BACKOFF = 2  # seconds, doubled per attempt
+SMTP_IDLE_TIMEOUT = 300  # close the reused SMTP session after this idle time
+
+# 3c) Per-coin details (used for descriptions)
+COINGECKO_COIN_URL = (
+    "https://api.coingecko.com/api/v3/coins/{coin_id}"
+    "?localization=false&market_data=false&community_data=false&developer_data=false"
+)
+
+# 3d) Full coin universe for DIFF_COINS_LIST mode, and where its
+#     snapshot (sorted IDs, one per line) is kept between cycles.
+COINGECKO_COINS_LIST_URL = "https://api.coingecko.com/api/v3/coins/list"
+COINS_LIST_SNAPSHOT_FILE = "CelebCoinSentry_coins_list_snapshot.txt"
+
+# Optional fuzzy stage for mangled names in name/symbol ("ELONMUSK",
+# "Donld Trumpp"): a trigram index picks candidates, which are kept if
+# 1 - edit distance / name length >= FUZZY_THRESHOLD. Only runs when the
+# exact matcher found nothing.
+FUZZY_MATCHING = False
+FUZZY_THRESHOLD = 0.7
+FUZZY_MAX_CANDIDATES = 50  # candidates scored per coin
 
 # Local file with celebrity names (one name per line)
 CELEBRITY_NAMES_FILE = "CelebCoinSentry_celebrity_names.txt"
 
-# Where we store alerted coins locally (to avoid duplicates)
+# Precompiled, memory-mapped matcher built from CELEBRITY_NAMES_FILE
+# (rebuilt automatically whenever the names file changes)
+CELEBRITY_MATCHER_CACHE_FILE = "CelebCoinSentry_celebrity_matcher.bin"
+
+# Hot reload: seconds between checks of the names file's mtime/size. A
+# changed file is rebuilt in a background thread and swapped in between
+# coins, without a restart (None disables).
+NAMES_RELOAD_CHECK_INTERVAL = 30
+
+# Where we store alerted coins locally (to avoid duplicates).
+# Append-only journal: one JSON record per alert, fsync'd on write and
+# compacted (atomically) once it grows past ALERTED_COINS_COMPACT_BYTES.
 ALERTED_COINS_FILE = "CelebCoinSentry_alerted_coins.txt"
+ALERTED_COINS_COMPACT_BYTES = 1024 * 1024
+
+# Suspect coins whose description lookup didn't fit in this cycle's budget
+DESCRIPTION_BACKLOG_FILE = "CelebCoinSentry_description_backlog.json"
+
+# On-disk cache of coin descriptions (SQLite), with TTL expiry and LRU cap
+DESCRIPTION_CACHE_FILE = "CelebCoinSentry_descriptions.sqlite3"
+DESCRIPTION_CACHE_TTL = 7 * 86400  # seconds before a description is refetched
+DESCRIPTION_CACHE_MAX_ENTRIES = 5000
+
+# Sharded mode: run SHARD_COUNT sentries side by side (e.g.
+# `python CelebCoinSentry.py --shard-index 0 --shard-count 4`, one per
+# index). Coins are split by a hash of their ID; alerts are claimed
+# atomically in SHARED_STATE_FILE so each coin is announced once.
+SHARD_COUNT = 1
+SHARD_INDEX = 0
+SHARED_STATE_FILE = "CelebCoinSentry_state.sqlite3"
+
+# Prometheus-format metrics at http://METRICS_HOST:METRICS_PORT/metrics
+# (set METRICS_PORT = None to disable). Each cycle also prints one JSON
+# summary line with per-stage timings.
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9100
+
+# On-demand profiling (CelebCoinSentry_Profiler.py): send PROFILE_SIGNAL to
+# the process, or create PROFILE_TRIGGER_FILE, and the next cycle is
+# captured (cProfile + tracemalloc + in-memory set sizes) into
+# profiling.PROFILE_DIR.
+PROFILE_SIGNAL = "SIGUSR1"
+PROFILE_TRIGGER_FILE = "CelebCoinSentry_profile.trigger"
 
 # -------------------------------------------------
 # Global in-memory sets
 # -------------------------------------------------
 CELEBRITY_NAMES = set()
 ALERTED_COIN_IDS = set()
+ALERTED_COIN_RECORDS = {}  # coin_id -> {"id", "ts", "celebrities"}
+CLEARED_COIN_IDS = set()  # coins already checked that didn't match
+_ALERTED_COINS_COMPACTED_SIZE = 0  # journal size right after the last compaction
+_ALERTED_COINS_LOCK = threading.Lock()  # matches are recorded from worker threads
+
+# Aho-Corasick automaton built once from CELEBRITY_NAMES
+CELEBRITY_MATCHER = build_matcher([])
+
+# Trigram index over CELEBRITY_NAMES (None unless FUZZY_MATCHING)
+CELEBRITY_FUZZY_INDEX = None
+
+# Hot-reload bookkeeping (see start_names_watcher())
+_NAMES_FILE_SIGNATURE = None  # (mtime_ns, size, inode) of the last file built
+_PENDING_NAMES = None  # set built by the watcher, waiting to be swapped in
+_PENDING_NAMES_LOCK = threading.Lock()
+_NAMES_RELOAD_LOCK = threading.Lock()  # one staging build at a time
+_NAMES_WATCHER = None
+
+# Read position of the "feed" source between cycles
+_FEED_STATE = {"offset": 0, "inode": None, "signature": None}
 
 # -------------------------------------------------
 # Request Helpers
@@ -90,68 +249,627 @@ def build_headers():
         return {"User-Agent": CUSTOM_USER_AGENT}
     return None
 
+# -------------------------------------------------
+# Rate Limiter (shared token bucket)
+# -------------------------------------------------
+
+_RATE_LOCK = threading.Lock()
+_RATE_TOKENS = float(COINGECKO_BURST)
+_RATE_UPDATED = time.monotonic()
+_RATE_BLOCKED_UNTIL = 0.0
+
+def _refill_tokens(now):
+    """Top up the bucket for time elapsed. Caller must hold _RATE_LOCK."""
+    global _RATE_TOKENS, _RATE_UPDATED
+    rate = COINGECKO_CALLS_PER_MINUTE / 60.0
+    _RATE_TOKENS = min(float(COINGECKO_BURST), _RATE_TOKENS + (now - _RATE_UPDATED) * rate)
+    _RATE_UPDATED = now
+
+def available_request_tokens(within=0):
+    """How many CoinGecko requests can go out in the next `within` seconds."""
+    with _RATE_LOCK:
+        now = time.monotonic()
+        _refill_tokens(now)
+        usable = within - max(0.0, _RATE_BLOCKED_UNTIL - now)
+        if usable < 0:
+            return 0
+        return int(_RATE_TOKENS + usable * COINGECKO_CALLS_PER_MINUTE / 60.0)
+
+def acquire_request_token():
+    """
+    Block until a request token is available (and any Retry-After window
+    has passed), then consume it. Safe to call from worker threads.
+    """
+    global _RATE_TOKENS
+    while True:
+        with _RATE_LOCK:
+            now = time.monotonic()
+            _refill_tokens(now)
+            if now >= _RATE_BLOCKED_UNTIL and _RATE_TOKENS >= 1:
+                _RATE_TOKENS -= 1
+                return
+            rate = COINGECKO_CALLS_PER_MINUTE / 60.0
+            wait = max(_RATE_BLOCKED_UNTIL - now, (1 - _RATE_TOKENS) / rate)
+        time.sleep(wait)
+        metrics.inc("rate_limit_wait_seconds_total", wait, api="coingecko")
+
+def block_requests_for(seconds):
+    """Pause all CoinGecko requests for `seconds` and drain the bucket."""
+    global _RATE_TOKENS, _RATE_BLOCKED_UNTIL
+    with _RATE_LOCK:
+        _RATE_TOKENS = 0.0
+        _RATE_BLOCKED_UNTIL = max(_RATE_BLOCKED_UNTIL, time.monotonic() + seconds)
+
+def parse_retry_after(response):
+    """
+    Read the Retry-After header (seconds or HTTP date).
+    Returns seconds to wait, or None if absent/unparseable.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def coingecko_get(url, headers=None, timeout=None, stage="fetch", **labels):
+    """
+    GET a CoinGecko URL through the shared rate limiter and HTTP client.
+    Retries 429/503 responses, honoring Retry-After or backing off
+    exponentially with jitter. Returns the final response.
+    Only the HTTP round trips are timed into stage_seconds{stage, labels};
+    limiter and backoff waits go to rate_limit_wait_seconds_total.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        acquire_request_token()
+        with metrics.timed(stage, **labels):
+            response = http.get(url, headers=headers, timeout=timeout)
+        if response.status_code not in (429, 503) or attempt == MAX_RETRIES:
+            return response
+        wait = parse_retry_after(response)
+        if wait is None:
+            wait = RATE_LIMIT_BACKOFF * (2 ** attempt) * random.uniform(1.0, 1.25)
+        print(f"[WARN] CoinGecko returned {response.status_code}; backing off {wait:.0f} seconds.")
+        block_requests_for(wait)
+    return response
+
+# -------------------------------------------------
+# Sharding and Shared State Store (SQLite WAL)
+# -------------------------------------------------
+#
+# With SHARD_COUNT > 1, several sentries run side by side. Each one only
+# checks coins whose ID hashes to its SHARD_INDEX, spends 1/SHARD_COUNT of
+# the CoinGecko budget, keeps its own per-shard state files, and records
+# alerts in SHARED_STATE_FILE, where an INSERT on the coin ID's primary key
+# is the alert-once claim: whichever worker inserts first sends the alert.
+
+_STATE_LOCK = threading.Lock()
+_STATE_CONN = None
+_STATE_LAST_ROWID = 0  # newest alerted row already merged into ALERTED_COIN_IDS
+
+def sharded_mode():
+    return SHARD_COUNT > 1
+
+def coin_shard(coin_id):
+    """Stable shard number for a coin ID (same on every worker and run)."""
+    digest = hashlib.blake2b(coin_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % SHARD_COUNT
+
+def in_my_shard(coin_id):
+    return not sharded_mode() or coin_shard(coin_id) == SHARD_INDEX
+
+def is_known_coin(coin_id):
+    """Already alerted, already cleared, or another shard's business."""
+    return coin_id in ALERTED_COIN_IDS or coin_id in CLEARED_COIN_IDS or not in_my_shard(coin_id)
+
+def shard_file(path):
+    """'state.json' -> 'state.shard1of4.json' in sharded mode."""
+    if not sharded_mode():
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.shard{SHARD_INDEX}of{SHARD_COUNT}{ext}"
+
+def configure_shard(index, count):
+    """
+    Make this process worker `index` of `count`: split the request budget,
+    give it its own state files and metrics port.
+    """
+    global SHARD_INDEX, SHARD_COUNT, COINGECKO_CALLS_PER_MINUTE, COINGECKO_BURST
+    global RECENTLY_ADDED_STATE_FILE, COINS_LIST_SNAPSHOT_FILE
+    global DESCRIPTION_BACKLOG_FILE, DESCRIPTION_CACHE_FILE, METRICS_PORT, _RATE_TOKENS
+    global PROFILE_TRIGGER_FILE
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {index} of {count}")
+    SHARD_INDEX, SHARD_COUNT = index, count
+    if not sharded_mode():
+        return
+    COINGECKO_CALLS_PER_MINUTE = COINGECKO_CALLS_PER_MINUTE / count
+    COINGECKO_BURST = max(1, COINGECKO_BURST // count)
+    with _RATE_LOCK:
+        _RATE_TOKENS = min(_RATE_TOKENS, float(COINGECKO_BURST))
+    RECENTLY_ADDED_STATE_FILE = shard_file(RECENTLY_ADDED_STATE_FILE)
+    COINS_LIST_SNAPSHOT_FILE = shard_file(COINS_LIST_SNAPSHOT_FILE)
+    DESCRIPTION_BACKLOG_FILE = shard_file(DESCRIPTION_BACKLOG_FILE)
+    DESCRIPTION_CACHE_FILE = shard_file(DESCRIPTION_CACHE_FILE)
+    PROFILE_TRIGGER_FILE = shard_file(PROFILE_TRIGGER_FILE)
+    if METRICS_PORT:
+        METRICS_PORT += index
+
+def _state_store():
+    """Open (once) the shared state store. Caller must hold _STATE_LOCK."""
+    global _STATE_CONN
+    if _STATE_CONN is None:
+        _STATE_CONN = sqlite3.connect(SHARED_STATE_FILE, timeout=30, check_same_thread=False)
+        _STATE_CONN.execute("PRAGMA journal_mode=WAL")
+        _STATE_CONN.execute("PRAGMA synchronous=FULL")
+        _STATE_CONN.execute(
+            "CREATE TABLE IF NOT EXISTS alerted ("
+            " coin_id TEXT PRIMARY KEY,"
+            " ts REAL,"
+            " celebrities TEXT NOT NULL,"
+            " shard INTEGER)"
+        )
+        _STATE_CONN.commit()
+    return _STATE_CONN
+
+def import_alerted_journal():
+    """Copy records from ALERTED_COINS_FILE into the store (idempotent)."""
+    if not os.path.exists(ALERTED_COINS_FILE):
+        return
+    rows = []
+    with open(ALERTED_COINS_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line) if line.startswith("{") else {"id": line}
+            except ValueError:
+                continue
+            if record.get("id"):
+                rows.append((record["id"], record.get("ts"),
+                             json.dumps(record.get("celebrities") or [])))
+    with _STATE_LOCK:
+        conn = _state_store()
+        conn.executemany(
+            "INSERT OR IGNORE INTO alerted (coin_id, ts, celebrities, shard)"
+            " VALUES (?, ?, ?, NULL)", rows
+        )
+        conn.commit()
+
+def refresh_alerted_coins():
+    """Merge coins alerted by any worker since the last refresh."""
+    global _STATE_LAST_ROWID
+    try:
+        with _STATE_LOCK:
+            rows = _state_store().execute(
+                "SELECT rowid, coin_id, ts, celebrities FROM alerted"
+                " WHERE rowid > ? ORDER BY rowid", (_STATE_LAST_ROWID,)
+            ).fetchall()
+    except sqlite3.Error as e:
+        print(f"[WARN] Could not read {SHARED_STATE_FILE}: {e}")
+        return
+    for rowid, coin_id, ts, celebrities in rows:
+        ALERTED_COIN_IDS.add(coin_id)
+        ALERTED_COIN_RECORDS[coin_id] = {"id": coin_id, "ts": ts,
+                                         "celebrities": json.loads(celebrities)}
+        _STATE_LAST_ROWID = rowid
+    metrics.set_gauge("alerted_coins", len(ALERTED_COIN_IDS))
+
+def claim_alerted_coin(coin_id, celebrities):
+    """
+    Atomically claim the alert for coin_id in the shared store.
+    Returns True if this worker won (and must send it), False if any
+    worker already alerted it, None if the store couldn't be written
+    (e.g. still locked after the timeout); the claim should be retried.
+    """
+    try:
+        with _STATE_LOCK:
+            conn = _state_store()
+            cursor = conn.execute(
+                "INSERT INTO alerted (coin_id, ts, celebrities, shard) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(coin_id) DO NOTHING",
+                (coin_id, time.time(), json.dumps(list(celebrities)), SHARD_INDEX),
+            )
+            conn.commit()
+            won = cursor.rowcount == 1
+    except sqlite3.Error as e:
+        print(f"[ERROR] Could not claim {coin_id} in {SHARED_STATE_FILE}: {e}")
+        metrics.inc("alert_claims_total", result="error")
+        return None
+    metrics.inc("alert_claims_total", result="won" if won else "lost")
+    return won
+
 # -------------------------------------------------
 # Load/Save Functions
 # -------------------------------------------------
 
-def load_celebrity_names():
-    """Load celebrity names from a local text file into a set."""
-    global CELEBRITY_NAMES
+def names_file_signature():
+    """(mtime_ns, size, inode) of the names file, or None if it's missing."""
+    try:
+        st = os.stat(CELEBRITY_NAMES_FILE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+def build_celebrity_names():
+    """
+    Build the matching structures for the current names file without
+    touching the globals. Returns (names, matcher, fuzzy_index).
+    """
     if not os.path.exists(CELEBRITY_NAMES_FILE):
         print(f"[WARN] {CELEBRITY_NAMES_FILE} not found. No celebrities loaded.")
-        CELEBRITY_NAMES = set()
+        return set(), build_matcher([]), None
+
+    matcher, from_cache = load_or_build_matcher(
+        CELEBRITY_NAMES_FILE, CELEBRITY_MATCHER_CACHE_FILE
+    )
+    names = MatcherNames(matcher)
+    metrics.inc("cache_requests_total", cache="matcher", result="hit" if from_cache else "miss")
+    source = CELEBRITY_MATCHER_CACHE_FILE if from_cache else CELEBRITY_NAMES_FILE
+    print(f"[INFO] Loaded {len(names)} celebrity names from {source}.")
+    fuzzy_index = build_trigram_index(names) if FUZZY_MATCHING else None
+    return names, matcher, fuzzy_index
+
+def install_celebrity_names(names, matcher, fuzzy_index):
+    """Make a built names set the active one."""
+    global CELEBRITY_NAMES, CELEBRITY_MATCHER, CELEBRITY_FUZZY_INDEX
+    CELEBRITY_NAMES, CELEBRITY_MATCHER, CELEBRITY_FUZZY_INDEX = names, matcher, fuzzy_index
+    metrics.set_gauge("celebrity_names", len(names))
+
+def load_celebrity_names():
+    """
+    Load the matcher for the local names file, mapping the precompiled
+    cache when it is current and rebuilding it otherwise.
+    CELEBRITY_NAMES becomes a read-only view of the normalized names.
+    """
+    global _NAMES_FILE_SIGNATURE
+    _NAMES_FILE_SIGNATURE = names_file_signature()
+    install_celebrity_names(*build_celebrity_names())
+
+def stage_celebrity_names_reload():
+    """
+    Rebuild the names set from the file if it changed since the last build
+    and leave it for apply_pending_celebrity_names() to swap in.
+    Blocking; runs off the main loop. Returns True if a new set was staged.
+    Callers (the watcher, the daemon's scrape and names tasks) are
+    serialized, so one change is built once.
+    """
+    global _NAMES_FILE_SIGNATURE, _PENDING_NAMES
+    with _NAMES_RELOAD_LOCK:
+        signature = names_file_signature()
+        if signature is None or signature == _NAMES_FILE_SIGNATURE:
+            return False
+        # Taken before the build: a write during the build triggers another.
+        _NAMES_FILE_SIGNATURE = signature
+        print(f"[INFO] {CELEBRITY_NAMES_FILE} changed. Rebuilding matcher in the background...")
+        try:
+            built = build_celebrity_names()
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Could not reload {CELEBRITY_NAMES_FILE}: {e}")
+            return False
+        with _PENDING_NAMES_LOCK:
+            _PENDING_NAMES = built
+        return True
+
+def _names_watcher_loop():
+    """Worker: rebuild the names set in the background when the file changes."""
+    while True:
+        time.sleep(NAMES_RELOAD_CHECK_INTERVAL)
+        stage_celebrity_names_reload()
+
+def start_names_watcher():
+    """Start the names-file watcher thread (once), unless hot reload is off."""
+    global _NAMES_WATCHER
+    if not NAMES_RELOAD_CHECK_INTERVAL:
         return
-    
-    with open(CELEBRITY_NAMES_FILE, "r", encoding="utf-8") as f:
-        names = [line.strip() for line in f if line.strip()]
-    CELEBRITY_NAMES = set(names)
-    print(f"[INFO] Loaded {len(CELEBRITY_NAMES)} celebrity names from {CELEBRITY_NAMES_FILE}.")
+    if _NAMES_WATCHER is None or not _NAMES_WATCHER.is_alive():
+        _NAMES_WATCHER = threading.Thread(
+            target=_names_watcher_loop, name="names-watcher", daemon=True
+        )
+        _NAMES_WATCHER.start()
+
+def apply_pending_celebrity_names():
+    """
+    Swap in a names set rebuilt by the watcher, if one is ready. Called
+    between coins, so each coin is matched against one consistent set.
+    Coins cleared against the old names are forgotten, since new names may
+    match them. Returns True if a swap happened.
+    """
+    global _PENDING_NAMES
+    if _PENDING_NAMES is None:
+        return False
+    with _PENDING_NAMES_LOCK:
+        built, _PENDING_NAMES = _PENDING_NAMES, None
+    if built is None:
+        return False
+    install_celebrity_names(*built)
+    CLEARED_COIN_IDS.clear()
+    metrics.inc("names_reloads_total")
+    print(f"[INFO] Hot-reloaded {len(CELEBRITY_NAMES)} celebrity names.")
+    return True
 
 def load_alerted_coins():
-    """Load previously alerted coin IDs from a file into ALERTED_COIN_IDS set."""
-    global ALERTED_COIN_IDS
+    """
+    Replay the alerted-coins journal into ALERTED_COIN_IDS.
+    Accepts JSON records and legacy plain coin-ID lines; a torn last line
+    (crash mid-append) is skipped.
+    In sharded mode the shared store is loaded instead (seeded once from
+    the journal).
+    """
+    global ALERTED_COIN_IDS, ALERTED_COIN_RECORDS, _STATE_LAST_ROWID
+    ALERTED_COIN_IDS = set()
+    ALERTED_COIN_RECORDS = {}
+    if sharded_mode():
+        _STATE_LAST_ROWID = 0
+        import_alerted_journal()
+        refresh_alerted_coins()
+        print(f"[INFO] Loaded {len(ALERTED_COIN_IDS)} alerted coins from {SHARED_STATE_FILE}.")
+        return
     if not os.path.exists(ALERTED_COINS_FILE):
-        ALERTED_COIN_IDS = set()
         return
 
+    skipped = 0
     with open(ALERTED_COINS_FILE, "r", encoding="utf-8") as f:
-        ids = [line.strip() for line in f if line.strip()]
-    ALERTED_COIN_IDS = set(ids)
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    skipped += 1
+                    continue
+            else:
+                record = {"id": line, "ts": None, "celebrities": []}
+            coin_id = record.get("id")
+            if coin_id:
+                ALERTED_COIN_RECORDS[coin_id] = record
+    ALERTED_COIN_IDS = set(ALERTED_COIN_RECORDS)
+    metrics.set_gauge("alerted_coins", len(ALERTED_COIN_IDS))
+    if skipped:
+        # Rewrite now so the next append doesn't land on a torn line.
+        print(f"[WARN] Skipped {skipped} unreadable record(s) in {ALERTED_COINS_FILE}.")
+        compact_alerted_coins()
     print(f"[INFO] Loaded {len(ALERTED_COIN_IDS)} alerted coins from {ALERTED_COINS_FILE}.")
 
-def save_alerted_coins():
-    """Save the current ALERTED_COIN_IDS set to file."""
-    with open(ALERTED_COINS_FILE, "w", encoding="utf-8") as f:
-        for coin_id in ALERTED_COIN_IDS:
-            f.write(f"{coin_id}\n")
+def record_alerted_coin(coin_id, celebrities):
+    """
+    Mark coin_id as alerted: add it to ALERTED_COIN_IDS and append an
+    fsync'd record (with timestamp and matched celebrities) to the journal.
+    In sharded mode the shared store is claimed instead.
+    Returns True if this process should send the alert, and None if the
+    shared store couldn't be claimed (retry later).
+    """
+    with _ALERTED_COINS_LOCK:
+        return _record_alerted_coin(coin_id, celebrities)
+
+def _record_alerted_coin(coin_id, celebrities):
+    if sharded_mode():
+        won = claim_alerted_coin(coin_id, celebrities)
+        if won is not None:
+            refresh_alerted_coins()
+        return won
+
+    record = {"id": coin_id, "ts": time.time(), "celebrities": list(celebrities)}
+    ALERTED_COIN_IDS.add(coin_id)
+    ALERTED_COIN_RECORDS[coin_id] = record
+    metrics.set_gauge("alerted_coins", len(ALERTED_COIN_IDS))
+
+    with open(ALERTED_COINS_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+    # Compact once the journal doubles past its last compacted size,
+    # so compaction cost stays amortized even for a large live set.
+    threshold = max(ALERTED_COINS_COMPACT_BYTES, 2 * _ALERTED_COINS_COMPACTED_SIZE)
+    if os.path.getsize(ALERTED_COINS_FILE) > threshold:
+        compact_alerted_coins()
+    return True
+
+def compact_alerted_coins():
+    """
+    Rewrite the journal with one record per coin. Written to a temp file,
+    fsync'd and renamed over the journal, so a crash leaves either the old
+    or the new file intact.
+    """
+    global _ALERTED_COINS_COMPACTED_SIZE
+    tmp_path = ALERTED_COINS_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in ALERTED_COIN_RECORDS.values():
+            f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, ALERTED_COINS_FILE)
+    _ALERTED_COINS_COMPACTED_SIZE = os.path.getsize(ALERTED_COINS_FILE)
+    print(f"[INFO] Compacted {ALERTED_COINS_FILE} to {len(ALERTED_COIN_RECORDS)} records.")
+
+def load_description_backlog():
+    """Load suspect coins deferred from a previous cycle (list of coin dicts)."""
+    if not os.path.exists(DESCRIPTION_BACKLOG_FILE):
+        return []
+    try:
+        with open(DESCRIPTION_BACKLOG_FILE, "r", encoding="utf-8") as f:
+            backlog = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Could not read {DESCRIPTION_BACKLOG_FILE}: {e}")
+        return []
+    return backlog if isinstance(backlog, list) else []
+
+def save_description_backlog(coins):
+    """Persist suspect coins that still need a description lookup."""
+    tmp_path = DESCRIPTION_BACKLOG_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(coins, f)
+    os.replace(tmp_path, DESCRIPTION_BACKLOG_FILE)
+
+# -------------------------------------------------
+# Description Cache (SQLite, TTL + LRU)
+# -------------------------------------------------
+
+_CACHE_LOCK = threading.Lock()
+_CACHE_CONN = None
+
+def _description_cache():
+    """Open (once) the description cache. Caller must hold _CACHE_LOCK."""
+    global _CACHE_CONN
+    if _CACHE_CONN is None:
+        _CACHE_CONN = sqlite3.connect(DESCRIPTION_CACHE_FILE, check_same_thread=False)
+        _CACHE_CONN.execute(
+            "CREATE TABLE IF NOT EXISTS descriptions ("
+            " coin_id TEXT PRIMARY KEY,"
+            " description TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        _CACHE_CONN.execute(
+            "CREATE INDEX IF NOT EXISTS descriptions_last_used ON descriptions (last_used)"
+        )
+        _CACHE_CONN.commit()
+    return _CACHE_CONN
+
+def get_cached_description(coin_id):
+    """
+    Return the cached description for coin_id, or None if missing or older
+    than DESCRIPTION_CACHE_TTL. A hit refreshes the entry's LRU position.
+    """
+    now = time.time()
+    try:
+        with _CACHE_LOCK:
+            conn = _description_cache()
+            row = conn.execute(
+                "SELECT description, fetched_at FROM descriptions WHERE coin_id = ?",
+                (coin_id,),
+            ).fetchone()
+            if row is None or now - row[1] > DESCRIPTION_CACHE_TTL:
+                return None
+            conn.execute(
+                "UPDATE descriptions SET last_used = ? WHERE coin_id = ?", (now, coin_id)
+            )
+            conn.commit()
+            return row[0]
+    except sqlite3.Error as e:
+        print(f"[WARN] Description cache read failed for {coin_id}: {e}")
+        return None
+
+def cache_description(coin_id, description):
+    """Store a freshly fetched description, then expire and evict old entries."""
+    now = time.time()
+    try:
+        with _CACHE_LOCK:
+            conn = _description_cache()
+            conn.execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?, ?)",
+                (coin_id, description, now, now),
+            )
+            conn.execute(
+                "DELETE FROM descriptions WHERE fetched_at < ?",
+                (now - DESCRIPTION_CACHE_TTL,),
+            )
+            conn.execute(
+                "DELETE FROM descriptions WHERE coin_id IN ("
+                " SELECT coin_id FROM descriptions"
+                " ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (DESCRIPTION_CACHE_MAX_ENTRIES,),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"[WARN] Description cache write failed for {coin_id}: {e}")
 
 # -------------------------------------------------
 # Coin Fetch (API + HTML)
 # -------------------------------------------------
 
-def get_coins_via_api():
+def fetch_markets_page(page, headers=None):
     """
-    Fetch coins from the CoinGecko /markets endpoint 
-    (top by market cap if not specifying category).
-    Returns a list of dicts with 'id', 'name', 'symbol', etc.
+    Fetch one page of the CoinGecko /markets endpoint.
+    Returns the list of coin dicts, or None on error.
     """
-    headers = build_headers()  # custom or None
+    url = f"{COINGECKO_API_URL}&per_page={MARKETS_PER_PAGE}&page={page}"
     try:
-        response = requests.get(COINGECKO_API_URL, headers=headers, timeout=20)
-        time.sleep(TIME_BETWEEN_REQUESTS)  # sleep to avoid rate-limits
+        response = coingecko_get(url, headers=headers, source="markets")
         response.raise_for_status()
-        data = response.json()
-        if not isinstance(data, list):
-            print("[WARN] Unexpected API response format.")
-            return []
-        return data
-    except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Failed to fetch data from CoinGecko API: {e}")
-        return []
+        with metrics.timed("parse", source="markets"):
+            data = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"[ERROR] Failed to fetch data from CoinGecko API (page {page}): {e}")
+        return None
+    if not isinstance(data, list):
+        print("[WARN] Unexpected API response format.")
+        return None
+    return data
+
+def get_coins_via_api():
+    """
+    Scan the CoinGecko /markets endpoint (top by market cap if not
+    specifying category) over up to MARKETS_SCAN_PAGES pages.
+    This is a generator: coins are yielded page by page while the next page
+    downloads in the background, so memory stays at about two pages.
+    Stops early at a page whose coins were all already alerted or cleared.
+    Yields dicts with 'id', 'name', 'symbol', etc.
+    """
+    headers = build_headers()  # custom or None
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        fetch_page = metrics.bind_cycle(profiling.bind(fetch_markets_page))
+        pending = prefetcher.submit(fetch_page, 1, headers)
+        for page in range(1, MARKETS_SCAN_PAGES + 1):
+            data = pending.result()
+            if not data:
+                return
+
+            # Rows without an ID are skipped later anyway; they mustn't
+            # decide (or, sharded, break) the all-known check.
+            data = [coin for coin in data if isinstance(coin, dict)]
+            ids = [coin["id"] for coin in data if coin.get("id")]
+            if ids and all(is_known_coin(coin_id) for coin_id in ids):
+                print(f"[INFO] Markets page {page} holds only known coins. Stopping scan.")
+                return
+
+            if page < MARKETS_SCAN_PAGES and len(data) >= MARKETS_PER_PAGE:
+                pending = prefetcher.submit(fetch_page, page + 1, headers)
+            else:
+                pending = None
+            yield from data
+            if pending is None:
+                return
+
+def load_recently_added_state():
+    """Load ETag/Last-Modified, content hash and seen slugs for the page."""
+    state = {"etag": None, "last_modified": None, "content_hash": None, "seen_slugs": []}
+    if os.path.exists(RECENTLY_ADDED_STATE_FILE):
+        try:
+            with open(RECENTLY_ADDED_STATE_FILE, "r", encoding="utf-8") as f:
+                state.update(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Could not read {RECENTLY_ADDED_STATE_FILE}: {e}")
+    return state
+
+def save_recently_added_state(state):
+    """Persist the page state (temp file + rename)."""
+    tmp_path = RECENTLY_ADDED_STATE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, RECENTLY_ADDED_STATE_FILE)
+
+def slug_from_href(href):
+    """'/en/coins/some-slug' -> 'some-slug' ('' if not a coin link)."""
+    return href.split("/en/coins/")[-1] if "/en/coins/" in href else ""
 
 def get_coins_via_recently_added_html():
     """
     Scrape the 'Recently Added' page on CoinGecko for newly listed coins.
+    Only coins listed since the last cycle are returned: the request is
+    conditional (If-None-Match / If-Modified-Since), an unchanged body
+    (same SHA-256) isn't parsed, and parsing stops at the first slug
+    already seen. The new validators and seen slugs are saved only once
+    the cycle has handled the returned coins (see defer_source_commit()).
     Returns a list of dicts with keys like:
         {
           'id': 'some-slug',
@@ -161,46 +879,47 @@ def get_coins_via_recently_added_html():
           'description': ''
         }
     """
-    headers = build_headers()  # custom or None
+    headers = dict(build_headers() or {})
+    state = load_recently_added_state()
+    if state["etag"]:
+        headers["If-None-Match"] = state["etag"]
+    if state["last_modified"]:
+        headers["If-Modified-Since"] = state["last_modified"]
+
     coins = []
     try:
-        response = requests.get(
-            COINGECKO_RECENTLY_ADDED_URL, 
-            headers=headers, 
-            timeout=20
-        )
-        time.sleep(TIME_BETWEEN_REQUESTS)  # sleep to avoid rate-limits
+        response = coingecko_get(COINGECKO_RECENTLY_ADDED_URL, headers=headers,
+                                 source="recently_added")
+        if response.status_code == 304:
+            print("[INFO] 'Recently Added' page not modified (304).")
+            metrics.inc("cache_requests_total", cache="recently_added", result="hit")
+            return coins
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
 
-        # The table of recently added coins is typically .table-scrollable > table > tbody
-        table_body = soup.select_one(".table-scrollable table tbody")
-        if not table_body:
-            print("[WARN] Could not find the 'Recently Added' table body.")
+        state["etag"] = response.headers.get("ETag")
+        state["last_modified"] = response.headers.get("Last-Modified")
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if content_hash == state["content_hash"]:
+            print("[INFO] 'Recently Added' page unchanged (same content hash).")
+            metrics.inc("cache_requests_total", cache="recently_added", result="hit")
+            save_recently_added_state(state)
             return coins
-        
-        rows = table_body.find_all("tr")
-        for row in rows:
-            cols = row.find_all("td")
-            if not cols or len(cols) < 2:
-                continue
-
-            anchor = row.select_one("a.tw-flex")
-            if not anchor:
-                continue
-            
-            name_span = anchor.select_one("span.tw-hidden")
-            if not name_span:
-                continue
-            name_text = name_span.get_text(strip=True)
+        state["content_hash"] = content_hash
+        metrics.inc("cache_requests_total", cache="recently_added", result="miss")
 
-            symbol_span = name_span.find_next_sibling("span")
-            if not symbol_span:
-                continue
-            symbol_text = symbol_span.get_text(strip=True)
+        seen = set(state["seen_slugs"])
+        with metrics.timed("parse", source="recently_added"):
+            rows = extract_recently_added_rows(
+                response.text,
+                HTML_PARSER_BACKEND,
+                stop_before=lambda href: slug_from_href(href) in seen,
+            )
+        if rows is None:
+            print("[WARN] Could not find the 'Recently Added' table body.")
+            return coins
 
-            href = anchor.get("href", "")
-            slug = href.split("/en/coins/")[-1] if "/en/coins/" in href else ""
+        for href, name_text, symbol_text in rows:
+            slug = slug_from_href(href)
 
             coin_dict = {
                 "id": slug or f"{name_text.lower().replace(' ', '-')}-unknown",
@@ -210,78 +929,458 @@ def get_coins_via_recently_added_html():
                 "description": ""
             }
             coins.append(coin_dict)
+
+        new_slugs = [coin["id"] for coin in coins]
+        state["seen_slugs"] = (new_slugs + state["seen_slugs"])[:RECENTLY_ADDED_SEEN_LIMIT]
+        defer_source_commit(lambda: save_recently_added_state(state))
+        print(f"[INFO] {len(coins)} new row(s) on the 'Recently Added' page.")
     except requests.exceptions.RequestException as e:
         print(f"[ERROR] Failed to fetch data from CoinGecko Recently Added page: {e}")
         return []
 
     return coins
 
+def load_coins_list_snapshot():
+    """
+    Load the previous /coins/list snapshot as a sorted list of IDs.
+    The file is plain sorted lines, so loading is a single split (no JSON).
+    Returns None if there is no snapshot yet.
+    """
+    if not os.path.exists(COINS_LIST_SNAPSHOT_FILE):
+        return None
+    with open(COINS_LIST_SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+        return f.read().split()
+
+def save_coins_list_snapshot(sorted_ids):
+    """Write the sorted IDs (temp file + rename)."""
+    tmp_path = COINS_LIST_SNAPSHOT_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(sorted_ids))
+    os.replace(tmp_path, COINS_LIST_SNAPSHOT_FILE)
+
+def diff_sorted_ids(old_ids, new_ids):
+    """
+    IDs in new_ids but not in old_ids. Both must be sorted; a single merge
+    walk, so no hash sets are built over the full universe.
+    """
+    added = []
+    i = 0
+    n_old = len(old_ids)
+    for coin_id in new_ids:
+        while i < n_old and old_ids[i] < coin_id:
+            i += 1
+        if i == n_old or old_ids[i] != coin_id:
+            added.append(coin_id)
+    return added
+
+def get_coins_via_list_diff():
+    """
+    Fetch the complete /coins/list and return only coins whose IDs weren't
+    in the previous snapshot. The first run just records a snapshot.
+    The new snapshot is saved once the cycle has handled the returned coins
+    (see defer_source_commit()).
+    Returns a list of dicts with 'id', 'name', 'symbol', etc.
+    """
+    headers = build_headers()
+    try:
+        response = coingecko_get(COINGECKO_COINS_LIST_URL, headers=headers,
+                                 timeout=(http.HTTP_CONNECT_TIMEOUT, 60), source="coins_list")
+        response.raise_for_status()
+        with metrics.timed("parse", source="coins_list"):
+            data = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"[ERROR] Failed to fetch CoinGecko /coins/list: {e}")
+        return []
+    if not isinstance(data, list):
+        print("[WARN] Unexpected /coins/list response format.")
+        return []
+
+    with metrics.timed("parse", source="coins_list"):
+        by_id = {entry["id"]: entry for entry in data if entry.get("id")}
+        current_ids = sorted(by_id)
+        previous_ids = load_coins_list_snapshot()
+    defer_source_commit(lambda: save_coins_list_snapshot(current_ids))
+
+    if previous_ids is None:
+        print(f"[INFO] Saved first /coins/list snapshot ({len(current_ids)} IDs). "
+              "New listings are reported from the next cycle.")
+        return []
+
+    added = diff_sorted_ids(previous_ids, current_ids)
+    print(f"[INFO] /coins/list: {len(current_ids)} IDs, {len(added)} new since last snapshot.")
+    return [
+        {
+            "id": coin_id,
+            "symbol": by_id[coin_id].get("symbol", ""),
+            "name": by_id[coin_id].get("name", ""),
+            "current_price": None,
+            "description": ""
+        }
+        for coin_id in added
+    ]
+
 def get_coin_description(coin_id):
     """
     If we want extended data for a coin by ID (like official description),
     we can do an extra call: /coins/{coin_id}?localization=false&market_data=false&community_data=false&developer_data=false
+    Served from the description cache when a fresh entry exists.
     """
+    cached = get_cached_description(coin_id)
+    if cached is not None:
+        return cached
+
     headers = build_headers()
-    url = f"https://api.coingecko.com/api/v3/coins/{coin_id}?localization=false&market_data=false&community_data=false&developer_data=false"
+    url = COINGECKO_COIN_URL.format(coin_id=coin_id)
     try:
-        response = requests.get(url, headers=headers, timeout=20)
-        time.sleep(TIME_BETWEEN_REQUESTS)  # sleep to avoid rate-limits
+        response = coingecko_get(url, headers=headers, stage="description_fetch")
         response.raise_for_status()
         info = response.json()
         desc = info.get("description", {}).get("en", "")
+        cache_description(coin_id, desc)
         return desc
     except requests.exceptions.RequestException as e:
         print(f"[ERROR] Failed to fetch description for {coin_id}: {e}")
         return ""
 
+def resolve_description(coin):
+    """
+    Fill coin['description'] from the coin source or the description cache,
+    without using the request budget. Returns False if it must be fetched.
+    """
+    if coin.get("description"):
+        return True  # the source already supplied it
+    description = get_cached_description(coin["id"])
+    if description is None:
+        metrics.inc("cache_requests_total", cache="description", result="miss")
+        return False
+    metrics.inc("cache_requests_total", cache="description", result="hit")
+    coin["description"] = description
+    return True
+
+def check_suspect(coin):
+    """
+    Final check with name + symbol + description. A match is claimed and
+    its alert queued straight away, without waiting for the rest of the
+    cycle. Returns True if an alert was queued, False if the coin is done
+    with, None if its claim failed and it should be retried next cycle
+    (it is neither recorded nor cleared). Safe to call from workers.
+    """
+    name = coin.get("name", "")
+    symbol = coin.get("symbol", "")
+    with metrics.timed("final_match"):
+        hits = is_celebrity_coin(name, symbol, coin.get("description", ""))
+    if not hits:
+        print(f"[INFO] {name} ({symbol}) not matching final celeb check.")
+        CLEARED_COIN_IDS.add(coin["id"])
+        return False
+
+    print(f"[INFO] Found potential celebrity coin: {name} ({symbol})")
+    coin["celebrities"] = matched_names(hits)
+    won = record_alerted_coin(coin["id"], coin["celebrities"])
+    if won is None:
+        print(f"[WARN] {name} ({symbol}) couldn't be claimed; retrying next cycle.")
+        return None
+    if not won:
+        print(f"[INFO] {name} ({symbol}) was already alerted by another worker.")
+        return False
+    enqueue_alerts([coin])
+    return True
+
+def fetch_and_check_suspect(coin):
+    """Worker: fetch a suspect's description, then run check_suspect()."""
+    coin["description"] = get_coin_description(coin["id"])
+    return check_suspect(coin)
+
+def get_coins_via_feed():
+    """
+    Read coins from COIN_FEED_FILE, a local JSONL file (one coin per line)
+    or JSON list, for testing and replaying recorded listings.
+    JSONL is tailed: each cycle reads only complete lines appended since the
+    last one (from the top again if the file was truncated or replaced).
+    A JSON list is re-read whenever the file changes.
+    Returns a list of coin dicts as found in the file.
+    """
+    try:
+        st = os.stat(COIN_FEED_FILE)
+    except OSError as e:
+        print(f"[WARN] Coin feed {COIN_FEED_FILE} not readable: {e}")
+        return []
+
+    if COIN_FEED_FILE.endswith(".json"):
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if signature == _FEED_STATE["signature"]:
+            return []
+        _FEED_STATE["signature"] = signature
+        try:
+            with open(COIN_FEED_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Could not read coin feed {COIN_FEED_FILE}: {e}")
+            return []
+        return [coin for coin in data if isinstance(coin, dict)] if isinstance(data, list) else []
+
+    if st.st_ino != _FEED_STATE["inode"] or st.st_size < _FEED_STATE["offset"]:
+        _FEED_STATE["inode"] = st.st_ino
+        _FEED_STATE["offset"] = 0
+    coins = []
+    with open(COIN_FEED_FILE, "rb") as f:
+        f.seek(_FEED_STATE["offset"])
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break  # line still being written; read it next cycle
+            _FEED_STATE["offset"] += len(raw)
+            try:
+                coin = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(coin, dict):
+                coins.append(coin)
+    return coins
+
+# -------------------------------------------------
+# Coin Sources (concurrent, deduplicated)
+# -------------------------------------------------
+#
+# A source is a function taking no arguments and returning an iterable of
+# coin dicts. Every configured source runs in its own thread; their coins
+# are merged as they arrive, normalized, and deduplicated on coin ID, so
+# whichever source sees a listing first hands it to matching.
+
+_SOURCE_COMMITS = []  # callables persisting source state, run at the end of a cycle
+_SOURCE_COMMITS_LOCK = threading.Lock()
+
+def defer_source_commit(commit):
+    """
+    Register a callable that saves a source's read position (seen slugs,
+    validators, snapshot). It runs only after the cycle has matched the
+    coins the source returned and queued their alerts, so a cycle that
+    fails halfway reads the same listings again instead of skipping them.
+    """
+    with _SOURCE_COMMITS_LOCK:
+        _SOURCE_COMMITS.append(commit)
+
+def discard_source_commits():
+    """Drop commits left over from a cycle that didn't finish."""
+    with _SOURCE_COMMITS_LOCK:
+        _SOURCE_COMMITS.clear()
+
+def commit_source_state():
+    """Run the commits registered during this cycle (see defer_source_commit())."""
+    with _SOURCE_COMMITS_LOCK:
+        commits = list(_SOURCE_COMMITS)
+        _SOURCE_COMMITS.clear()
+    for commit in commits:
+        try:
+            commit()
+        except OSError as e:
+            print(f"[WARN] Could not save coin source state: {e}")
+
+COIN_SOURCE_FUNCTIONS = {
+    "recently_added": get_coins_via_recently_added_html,
+    "markets": get_coins_via_api,
+    "coins_list": get_coins_via_list_diff,
+    "feed": get_coins_via_feed,
+}
+
+def configured_sources():
+    """COIN_SOURCES, or the single source picked by the legacy mode flags."""
+    if COIN_SOURCES:
+        return list(COIN_SOURCES)
+    if DIFF_COINS_LIST:
+        return ["coins_list"]
+    return ["recently_added"] if SCRAPE_RECENTLY_ADDED else ["markets"]
+
+def normalize_coin(coin, source):
+    """
+    Coerce a source's coin dict to the fields the pipeline uses.
+    Descriptions may be plain strings or CoinGecko's {'en': ...}.
+    """
+    description = coin.get("description") or ""
+    if isinstance(description, dict):
+        description = description.get("en") or ""
+    return {
+        "id": str(coin.get("id") or "").strip(),
+        "name": str(coin.get("name") or "").strip(),
+        "symbol": str(coin.get("symbol") or "").strip(),
+        "current_price": coin.get("current_price"),
+        "description": description,
+        "source": source,
+    }
+
+def stream_coin_sources(sources):
+    """
+    Run each source in a thread and yield (source, coin) pairs in arrival
+    order. A source that raises is logged and simply ends early.
+    At most SOURCE_QUEUE_SIZE coins wait at a time; sources block beyond
+    that, and give up if the consumer stops reading.
+    """
+    arrivals = queue.Queue(maxsize=SOURCE_QUEUE_SIZE)
+    stopped = threading.Event()
+
+    def deliver(item):
+        while not stopped.is_set():
+            try:
+                arrivals.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(source):
+        try:
+            for coin in COIN_SOURCE_FUNCTIONS[source]():
+                if not deliver((source, coin)):
+                    return
+        except Exception as e:
+            print(f"[ERROR] Coin source '{source}' failed: {e}")
+        finally:
+            deliver((source, None))
+
+    running = 0
+    for source in sources:
+        if source not in COIN_SOURCE_FUNCTIONS:
+            print(f"[ERROR] Unknown coin source '{source}'. Skipping it.")
+            continue
+        threading.Thread(
+            target=metrics.bind_cycle(profiling.bind(produce)), args=(source,),
+            name=f"source-{source}", daemon=True,
+        ).start()
+        running += 1
+
+    try:
+        while running:
+            source, coin = arrivals.get()
+            if coin is None:
+                running -= 1
+                continue
+            yield source, coin
+    finally:
+        stopped.set()  # unblock sources if the cycle stopped reading early
+
 def get_coins():
     """
-    Decide whether to scrape the Recently Added HTML page or fetch from the API,
-    based on SCRAPE_RECENTLY_ADDED config.
+    Stream coins from every configured source (see configured_sources()),
+    normalized and deduplicated on coin ID; the first source to report a
+    coin wins. Returns an iterator of coin dicts.
     """
-    if SCRAPE_RECENTLY_ADDED:
-        print("[INFO] Scraping CoinGecko 'Recently Added' HTML page...")
-        return get_coins_via_recently_added_html()
-    else:
-        print("[INFO] Fetching coins via CoinGecko API (top market cap)...")
-        return get_coins_via_api()
+    sources = configured_sources()
+    print(f"[INFO] Reading coins from: {', '.join(sources)}")
+    seen = set()
+    for source, coin in stream_coin_sources(sources):
+        coin = normalize_coin(coin, source)
+        metrics.inc("source_coins_total", source=source)
+        if coin["id"] in seen:
+            metrics.inc("duplicate_coins_total", source=source)
+            continue
+        if coin["id"]:
+            seen.add(coin["id"])
+        yield coin
 
 # -------------------------------------------------
 # Celebrity Detection (two-step approach)
 # -------------------------------------------------
 
+def find_celebrity_matches(text):
+    """
+    Run the shared matcher over text.
+    Returns every hit as a (start, end, name) tuple.
+    """
+    return find_matches(CELEBRITY_MATCHER, text)
+
+def find_fuzzy_celebrity_matches(text):
+    """
+    Run the optional fuzzy stage over text (name/symbol only; descriptions
+    are too long and too noisy for it).
+    Returns (start, end, name, score) tuples, or [] when disabled.
+    """
+    if CELEBRITY_FUZZY_INDEX is None:
+        return []
+    return find_fuzzy_matches(
+        CELEBRITY_FUZZY_INDEX, text, FUZZY_THRESHOLD, FUZZY_MAX_CANDIDATES
+    )
+
+def fuzzy_name_symbol_hits(name, symbol):
+    """Fuzzy hits on name/symbol as (start, end, name), printing each with its score."""
+    hits = []
+    for start, end, celeb, score in find_fuzzy_celebrity_matches(f"{name} {symbol}"):
+        print(f"[DEBUG] Fuzzy match: coin '{name}' resembles '{celeb}' (score {score:.2f}).")
+        hits.append((start, end, celeb))
+    return hits
+
 def debug_partial_celeb_check(name, symbol):
     """
     Quick partial check on just 'name' and 'symbol'
     to see if it might reference a celebrity.
-    If true, we consider it "suspect" (to fetch description).
-    Also prints which celebrity triggered the partial match for debugging.
-    """
-    text = f"{name} {symbol}".lower()
-    for celeb in CELEBRITY_NAMES:
-        clow = celeb.lower()
-        if clow in text:
-            print(f"[DEBUG] Partial match: coin '{name}' matched '{celeb}' in name/symbol.")
-            return True
-    return False
+    If any hits, we consider it "suspect" (to fetch description).
+    Also prints every celebrity that triggered the partial match for debugging.
+    Falls back to the fuzzy stage (if enabled) when nothing matched exactly.
+    Returns the list of hits (empty if none).
+    """
+    hits = find_celebrity_matches(f"{name} {symbol}")
+    for celeb in matched_names(hits):
+        print(f"[DEBUG] Partial match: coin '{name}' matched '{celeb}' in name/symbol.")
+    if not hits:
+        hits = fuzzy_name_symbol_hits(name, symbol)
+    return hits
 
 def is_celebrity_coin(name, symbol, description):
     """
     Final check (name + symbol + description).
-    Shows which celeb triggered the final match for debugging.
-    """
-    text = f"{name} {symbol} {description}".lower()
-    for celeb in CELEBRITY_NAMES:
-        clow = celeb.lower()
-        if clow in text:
-            print(f"[DEBUG] Final match: coin '{name}' matched '{celeb}' in full text.")
-            return True
-    return False
+    Shows every celeb that triggered the final match for debugging.
+    Falls back to fuzzy name/symbol hits (if enabled) when nothing matched exactly.
+    Returns the list of hits (empty if none).
+    """
+    hits = find_celebrity_matches(f"{name} {symbol} {description}")
+    for celeb in matched_names(hits):
+        print(f"[DEBUG] Final match: coin '{name}' matched '{celeb}' in full text.")
+    if not hits:
+        hits = fuzzy_name_symbol_hits(name, symbol)
+    return hits
 
 # -------------------------------------------------
 # Alert Methods (Email / Discord)
 # -------------------------------------------------
 
+_SMTP_SESSION = None  # owned by the alert dispatcher thread
+_DISCORD_BLOCKED_UNTIL = 0.0
+
+def get_smtp_session():
+    """
+    Return the open, authenticated SMTP session, (re)connecting if it was
+    never opened or the server dropped it.
+    """
+    global _SMTP_SESSION
+    if _SMTP_SESSION is not None:
+        try:
+            if _SMTP_SESSION.noop()[0] == 250:
+                return _SMTP_SESSION
+        except (smtplib.SMTPException, OSError):
+            pass
+        close_smtp_session()
+
+    server = smtplib.SMTP(EMAIL_SMTP_SERVER, EMAIL_SMTP_PORT, timeout=30)
+    try:
+        if EMAIL_USE_STARTTLS:
+            server.starttls(context=ssl.create_default_context())
+        if EMAIL_PASSWORD:
+            server.login(EMAIL_SENDER, EMAIL_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    _SMTP_SESSION = server
+    return server
+
+def close_smtp_session():
+    """Politely close the SMTP session, if any."""
+    global _SMTP_SESSION
+    if _SMTP_SESSION is None:
+        return
+    try:
+        _SMTP_SESSION.quit()
+    except (smtplib.SMTPException, OSError):
+        _SMTP_SESSION.close()
+    _SMTP_SESSION = None
+
 def send_alert_email(coin):
     subject = f"Celebrity Coin Alert: {coin['name']} ({coin['symbol']})"
     body = (
@@ -298,91 +1397,335 @@ def send_alert_email(coin):
     msg["Subject"] = subject
     msg.attach(MIMEText(body, "plain"))
 
-    try:
-        context = ssl.create_default_context()
-        with smtplib.SMTP(EMAIL_SMTP_SERVER, EMAIL_SMTP_PORT) as server:
-            server.starttls(context=context)
-            server.login(EMAIL_SENDER, EMAIL_PASSWORD)
-            server.send_message(msg)
-        print("[INFO] Email alert sent.")
-    except Exception as e:
-        print(f"[ERROR] Failed to send email: {e}")
-
-def send_alert_discord(coin):
-    content_lines = [
-        "**Celebrity Coin Alert**",
-        f"**Name**: {coin['name']} ({coin['symbol']})",
-        f"**Price**: ${coin.get('current_price', 'N/A')}",
-        f"**Link**: https://www.coingecko.com/en/coins/{coin['id']}"
-    ]
-    content = "\n".join(content_lines)
+    with metrics.timed("alert", channel="email"):
+        for attempt in range(ALERT_MAX_RETRIES + 1):
+            try:
+                get_smtp_session().send_message(msg)
+                print("[INFO] Email alert sent.")
+                metrics.inc("alerts_total", channel="email", result="sent")
+                return True
+            except Exception as e:
+                close_smtp_session()
+                if attempt == ALERT_MAX_RETRIES:
+                    print(f"[ERROR] Failed to send email: {e}")
+                    metrics.inc("alerts_total", channel="email", result="failed")
+                    return False
+                time.sleep(ALERT_RETRY_BACKOFF * (2 ** attempt))
+    return False
 
-    data = {"content": content}
-    if DISCORD_BOT_NAME:
-        data["username"] = DISCORD_BOT_NAME
-    if DISCORD_BOT_ICON:
-        data["avatar_url"] = DISCORD_BOT_ICON
+def build_discord_embed(coin):
+    """One Discord embed for a coin, trimmed to the webhook's field limits."""
+    title = f"{coin['name']} ({coin['symbol']})"[:256]
+    fields = [{"name": "Price", "value": f"${coin.get('current_price', 'N/A')}", "inline": True}]
+    if coin.get("celebrities"):
+        fields.append({"name": "Matched", "value": ", ".join(coin["celebrities"])[:1024]})
+    return {
+        "title": title,
+        "url": f"https://www.coingecko.com/en/coins/{coin['id']}",
+        "fields": fields,
+    }
 
-    try:
-        response = requests.post(DISCORD_WEBHOOK_URL, json=data, timeout=10)
-        response.raise_for_status()
-        print("[INFO] Discord alert posted.")
-    except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Failed to post to Discord: {e}")
+def _embed_size(embed):
+    """Characters an embed counts against Discord's per-message total."""
+    return len(embed["title"]) + sum(len(f["name"]) + len(f["value"]) for f in embed["fields"])
+
+def post_discord_payload(data):
+    """
+    POST one webhook message, waiting out Discord's rate limits.
+    Honors 429 Retry-After (header or JSON body) and the bucket headers
+    (X-RateLimit-Remaining / X-RateLimit-Reset-After); retries network
+    errors and 5xx with exponential backoff. Returns True on success.
+    """
+    global _DISCORD_BLOCKED_UNTIL
+    for attempt in range(ALERT_MAX_RETRIES + 1):
+        wait = _DISCORD_BLOCKED_UNTIL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+            metrics.inc("rate_limit_wait_seconds_total", wait, api="discord")
+
+        try:
+            response = http.post(DISCORD_WEBHOOK_URL, json=data)
+        except requests.exceptions.RequestException as e:
+            if attempt == ALERT_MAX_RETRIES:
+                print(f"[ERROR] Failed to post to Discord: {e}")
+                return False
+            time.sleep(ALERT_RETRY_BACKOFF * (2 ** attempt))
+            continue
+
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset_after = float(response.headers.get("X-RateLimit-Reset-After", 1))
+            _DISCORD_BLOCKED_UNTIL = time.monotonic() + reset_after
+
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response)
+            if retry_after is None:
+                try:
+                    retry_after = float(response.json().get("retry_after", 1))
+                except (ValueError, AttributeError):
+                    retry_after = ALERT_RETRY_BACKOFF * (2 ** attempt)
+            print(f"[WARN] Discord rate limit hit; retrying in {retry_after:.1f} seconds.")
+            _DISCORD_BLOCKED_UNTIL = time.monotonic() + retry_after
+            continue
+        if response.status_code >= 500 and attempt < ALERT_MAX_RETRIES:
+            time.sleep(ALERT_RETRY_BACKOFF * (2 ** attempt))
+            continue
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"[ERROR] Failed to post to Discord: {e}")
+            return False
+        return True
+
+    print("[ERROR] Failed to post to Discord: retries exhausted.")
+    return False
+
+def send_alert_discord(coins):
+    """
+    Post coins as few webhook messages as possible: up to
+    DISCORD_MAX_EMBEDS embeds and DISCORD_MAX_EMBED_CHARS characters each.
+    """
+    batches = [[]]
+    batch_chars = 0
+    for coin in coins:
+        embed = build_discord_embed(coin)
+        size = _embed_size(embed)
+        if batches[-1] and (len(batches[-1]) >= DISCORD_MAX_EMBEDS
+                            or batch_chars + size > DISCORD_MAX_EMBED_CHARS):
+            batches.append([])
+            batch_chars = 0
+        batches[-1].append(embed)
+        batch_chars += size
+
+    for embeds in batches:
+        if not embeds:
+            continue
+        data = {"content": f"**Celebrity Coin Alert** ({len(embeds)} coin(s))", "embeds": embeds}
+        if DISCORD_BOT_NAME:
+            data["username"] = DISCORD_BOT_NAME
+        if DISCORD_BOT_ICON:
+            data["avatar_url"] = DISCORD_BOT_ICON
+        with metrics.timed("alert", channel="discord"):
+            posted = post_discord_payload(data)
+        metrics.inc("alerts_total", len(embeds), channel="discord",
+                    result="sent" if posted else "failed")
+        if posted:
+            print(f"[INFO] Discord alert posted ({len(embeds)} coin(s)).")
 
-def send_alert(coin):
+def send_alerts(coins):
+    """Deliver one cycle's alerts on every configured channel."""
     if ALERT_METHOD in ["email", "both"]:
-        send_alert_email(coin)
+        for coin in coins:
+            send_alert_email(coin)
     if ALERT_METHOD in ["discord", "both"]:
-        send_alert_discord(coin)
+        send_alert_discord(coins)
+
+# -------------------------------------------------
+# Alert Dispatch Queue
+# -------------------------------------------------
+
+ALERT_QUEUE = queue.Queue()
+_ALERT_DISPATCHER = None
+
+def _alert_dispatcher_loop():
+    """Worker: deliver queued matches; close SMTP after an idle spell."""
+    while True:
+        try:
+            coins = ALERT_QUEUE.get(timeout=SMTP_IDLE_TIMEOUT)
+        except queue.Empty:
+            close_smtp_session()
+            continue
+        # Matches are queued one by one; send whatever has piled up together.
+        batches = 1
+        while True:
+            try:
+                coins = coins + ALERT_QUEUE.get_nowait()
+            except queue.Empty:
+                break
+            batches += 1
+        try:
+            send_alerts(coins)
+        except Exception as e:
+            print(f"[ERROR] Alert delivery failed: {e}")
+        finally:
+            for _ in range(batches):
+                ALERT_QUEUE.task_done()
+
+def start_alert_dispatcher():
+    """Start the background alert worker (once)."""
+    global _ALERT_DISPATCHER
+    if _ALERT_DISPATCHER is None or not _ALERT_DISPATCHER.is_alive():
+        _ALERT_DISPATCHER = threading.Thread(
+            target=_alert_dispatcher_loop, name="alert-dispatcher", daemon=True
+        )
+        _ALERT_DISPATCHER.start()
+
+def enqueue_alerts(coins):
+    """Hand matched coins to the dispatcher without waiting on delivery."""
+    if coins:
+        start_alert_dispatcher()
+        ALERT_QUEUE.put(list(coins))
 
 # -------------------------------------------------
 # Main Script
 # -------------------------------------------------
 
-def main():
+def profile_sizes():
+    """Sizes of the long-lived in-memory sets, for profile reports."""
+    return {
+        "celebrity_names": len(CELEBRITY_NAMES),
+        "celebrity_matcher_bytes": len(CELEBRITY_MATCHER["name_blob"]),
+        "alerted_coin_ids": len(ALERTED_COIN_IDS),
+        "alerted_coin_ids_bytes": sys.getsizeof(ALERTED_COIN_IDS),
+        "cleared_coin_ids": len(CLEARED_COIN_IDS),
+        "cleared_coin_ids_bytes": sys.getsizeof(CLEARED_COIN_IDS),
+    }
+
+def run_cycle():
+    """
+    One polling cycle: fetch coins, partial check, description lookups
+    within budget, final check, and hand matches to the alert queue.
+    Returns a summary dict of counts for the cycle, plus its duration and
+    per-stage timings (seconds).
+    Captured with the profiler when triggered (see PROFILE_SIGNAL).
+    """
+    return profiling.profiled_call("sentry", _run_cycle, PROFILE_TRIGGER_FILE, profile_sizes)
+
+def _run_cycle():
+    started = time.perf_counter()
+    waited = metrics.counter_value("rate_limit_wait_seconds_total", api="coingecko")
+    metrics.begin_cycle()
+    discard_source_commits()
+    if sharded_mode():
+        refresh_alerted_coins()
+    coins = get_coins()
+
+    # Each suspect is checked as soon as its source reports it: cached and
+    # source-supplied descriptions are checked here, the rest are fetched
+    # and checked on the pool while later coins keep arriving. Lookups that
+    # don't fit in the budget for DESCRIPTION_FETCH_WINDOW are persisted
+    # and retried next cycle.
+    suspects, deferred, fetches, checked = [], [], [], []
+    retry = []  # matched, but the alert couldn't be claimed
+    seen_ids = set()
+    n_coins = 0
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+        fetch_and_check = metrics.bind_cycle(profiling.bind(fetch_and_check_suspect))
+
+        def record_check(coin, result):
+            if result is None:
+                retry.append(coin)
+            else:
+                checked.append(result)
+
+        def handle_suspect(coin):
+            suspects.append(coin)
+            seen_ids.add(coin["id"])
+            if resolve_description(coin):
+                record_check(coin, check_suspect(coin))
+                return
+            # In-flight lookups may not have drawn their token yet.
+            in_flight = sum(1 for future, _ in fetches if not future.done())
+            if available_request_tokens(DESCRIPTION_FETCH_WINDOW) > in_flight:
+                fetches.append((pool.submit(fetch_and_check, coin), coin))
+            else:
+                deferred.append(coin)
+
+        # Suspects deferred last cycle go first; they've waited longest.
+        for coin in load_description_backlog():
+            coin_id = coin.get("id", "")
+            if coin_id and coin_id not in ALERTED_COIN_IDS and coin_id not in seen_ids:
+                handle_suspect(coin)
+
+        for coin in coins:
+            n_coins += 1
+            apply_pending_celebrity_names()
+            coin_id = coin.get("id", "")
+            name = coin.get("name", "")
+            symbol = coin.get("symbol", "")
+
+            # Skip if missing ID, already alerted/cleared, another shard's or already queued
+            if not coin_id or is_known_coin(coin_id) or coin_id in seen_ids:
+                continue
+
+            # 1) Quick partial check on name/symbol
+            with metrics.timed("partial_match"):
+                partial_hits = debug_partial_celeb_check(name, symbol)
+            if not partial_hits:
+                print(f"[INFO] {name} ({symbol}) not matching partial celeb criteria.")
+                CLEARED_COIN_IDS.add(coin_id)
+                continue
+
+            # 2) Final check (after a description lookup if needed); a match
+            #    is alerted right away
+            handle_suspect(coin)
+
+        if not n_coins:
+            print("[WARN] No coins found. Retrying next cycle...")
+        for future, coin in fetches:
+            record_check(coin, future.result())
+
+    # Unclaimed matches go back through the backlog (with their description).
+    save_description_backlog(retry + deferred)
+    if fetches or deferred:
+        print(f"[INFO] Fetched {len(fetches)} descriptions "
+              f"({len(deferred)} deferred to next cycle).")
+    matched = sum(checked)
+
+    # 3) Only now move the sources past the coins this cycle handled
+    commit_source_state()
+
+    metrics.inc("cycles_total")
+    metrics.inc("coins_seen_total", n_coins)
+    metrics.inc("suspects_total", len(suspects))
+    return {
+        "coins": n_coins,
+        "suspects": len(suspects),
+        "fetched": len(checked) + len(retry),
+        "deferred": len(deferred),
+        "unclaimed": len(retry),
+        "matched": matched,
+        "seconds": round(time.perf_counter() - started, 6),
+        "rate_limit_wait_seconds": round(
+            metrics.counter_value("rate_limit_wait_seconds_total", api="coingecko") - waited, 3
+        ),
+        "stages": metrics.end_cycle(),
+    }
+
+def log_cycle_summary(summary):
+    """Print one machine-readable JSON line describing the finished cycle."""
+    print(json.dumps({"event": "cycle", "ts": round(time.time(), 3), **summary}))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Watch CoinGecko for celebrity-themed coins.")
+    parser.add_argument("--shard-index", type=int, default=SHARD_INDEX,
+                        help="This worker's shard (0-based).")
+    parser.add_argument("--shard-count", type=int, default=SHARD_COUNT,
+                        help="Number of workers sharing the coin ID space.")
+    args = parser.parse_args(argv)
+    configure_shard(args.shard_index, args.shard_count)
+
     print(f"[INFO] {SCRIPT_NAME} v{VERSION} by {AUTHOR_NAME} started.")
+    if sharded_mode():
+        print(f"[INFO] Shard {SHARD_INDEX} of {SHARD_COUNT} (state in {SHARED_STATE_FILE})")
     print(f"[INFO] Alert method = {ALERT_METHOD}")
     print(f"[INFO] SCRAPE_RECENTLY_ADDED = {SCRAPE_RECENTLY_ADDED}")
-    print(f"[INFO] TIME_BETWEEN_REQUESTS = {TIME_BETWEEN_REQUESTS} seconds")
+    print(f"[INFO] DIFF_COINS_LIST = {DIFF_COINS_LIST}")
+    print(f"[INFO] Coin sources = {', '.join(configured_sources())}")
+    print(f"[INFO] FUZZY_MATCHING = {FUZZY_MATCHING} (threshold {FUZZY_THRESHOLD})")
+    print(f"[INFO] COINGECKO_CALLS_PER_MINUTE = {COINGECKO_CALLS_PER_MINUTE}")
     print(f"[INFO] USE_CUSTOM_USER_AGENT = {USE_CUSTOM_USER_AGENT}")
     print("[INFO] Loading data...")
 
     load_celebrity_names()
     load_alerted_coins()
+    start_alert_dispatcher()
+    start_names_watcher()
+    metrics.start_metrics_server(METRICS_PORT, METRICS_HOST)
+    profiling.install_signal_trigger("sentry", PROFILE_SIGNAL)
 
     while True:
-        coins = get_coins()
-        if not coins:
-            print("[WARN] No coins found. Retrying next cycle...")
-        else:
-            for coin in coins:
-                coin_id = coin.get("id", "")
-                name = coin.get("name", "")
-                symbol = coin.get("symbol", "")
-
-                # Skip if missing ID or already alerted
-                if not coin_id or coin_id in ALERTED_COIN_IDS:
-                    continue
-
-                # 1) Quick partial check on name/symbol
-                if not debug_partial_celeb_check(name, symbol):
-                    print(f"[INFO] {name} ({symbol}) not matching partial celeb criteria.")
-                    continue
-
-                # 2) If partial check is True, fetch description
-                description = get_coin_description(coin_id)
-                coin["description"] = description
-
-                # 3) Final check with name + symbol + description
-                if is_celebrity_coin(name, symbol, description):
-                    print(f"[INFO] Found potential celebrity coin: {name} ({symbol})")
-                    send_alert(coin)
-                    ALERTED_COIN_IDS.add(coin_id)
-                    save_alerted_coins()
-                else:
-                    print(f"[INFO] {name} ({symbol}) not matching final celeb check.")
-
+        log_cycle_summary(run_cycle())
         print(f"[INFO] Sleeping {CHECK_INTERVAL} seconds before next check...")
         time.sleep(CHECK_INTERVAL)
 
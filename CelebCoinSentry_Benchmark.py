@@ -0,0 +1,650 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import threading
+import contextlib
+import tracemalloc
+import multiprocessing
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from CelebCoinSentry_Extract import (
+    BACKENDS,
+    extract_list_item_links,
+    extract_recently_added_rows,
+    lxml,
+)
+
+# -------------------------------------------------
+# CelebCoinSentry Benchmark Metadata
+# -------------------------------------------------
+SCRIPT_NAME = "CelebCoinSentry_Benchmark"
+AUTHOR_NAME = "rnvntr"
+VERSION = "1.0.0"
+
+# -------------------------------------------------
+# Defaults
+# -------------------------------------------------
+# Recorded responses (see the `record` command). Missing fixtures are
+# replaced by synthetic ones, and results say which was used.
+FIXTURES_DIR = "CelebCoinSentry_bench_fixtures"
+
+MATCH_NAME_COUNTS = (1000, 10000, 100000)
+MATCH_DESCRIPTION_LENGTHS = (0, 1000, 10000)
+LOAD_SIZES = (10000, 100000)
+REGRESSION_THRESHOLD = 0.20  # `compare` flags results >20% slower
+
+# -------------------------------------------------
+# Synthetic Inputs
+# -------------------------------------------------
+
+FIRST_NAMES = ["Taylor", "Elon", "Kim", "Oprah", "Lionel", "Rihanna", "Keanu", "Serena",
+               "Dwayne", "Ariana", "Cristiano", "Beyonce", "Snoop", "Jackie", "Lady"]
+LAST_NAMES = ["Swift", "Musk", "Kardashian", "Winfrey", "Messi", "Fenty", "Reeves",
+              "Williams", "Johnson", "Grande", "Ronaldo", "Knowles", "Dogg", "Chan", "Gaga"]
+FILLER_WORDS = ["token", "community", "driven", "meme", "coin", "on", "the", "chain",
+                "with", "zero", "tax", "and", "locked", "liquidity", "to", "moon"]
+
+def synthetic_name(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.randrange(10**6)}"
+
+def synthetic_person_name(rng):
+    """Like synthetic_name, but shaped like a real list entry (no digits)."""
+    surname = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(7)).capitalize()
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}-{surname}"
+
+def synthetic_names(n, seed=0):
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < n:
+        names.add(synthetic_name(rng))
+    return sorted(names)
+
+def synthetic_description(length, seed=0):
+    rng = random.Random(seed)
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(FILLER_WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:length]
+
+def synthetic_list_page(n_items, seed=0):
+    """
+    A Wikipedia-like list page: n_items linked <li> names inside
+    div.mw-parser-output, surrounded by the navigation/boilerplate that
+    real pages carry (which a restricted parse can skip).
+    """
+    rng = random.Random(seed)
+    noise = "".join(
+        f'<li><a href="/wiki/Nav_{i}">Navigation link {i}</a></li>' for i in range(n_items // 2)
+    )
+    items = "".join(
+        f'<li><a href="/wiki/{name.replace(" ", "_")}" title="x">{name}</a>, actor (born 19{i % 100:02d})'
+        f'<sup><a href="#cite_{i}">[{i}]</a></sup></li>'
+        for i, name in enumerate(synthetic_person_name(rng) for _ in range(n_items))
+    )
+    return (
+        "<html><head><title>List</title><script>var x = 1;</script></head><body>"
+        f'<div id="mw-navigation"><ul>{noise}</ul></div>'
+        f'<div class="mw-body"><div class="mw-parser-output"><p>Intro</p><ul>{items}</ul>'
+        '<table class="wikitable"><tr><td>a</td><td>b</td></tr></table></div></div>'
+        f'<div id="footer"><ul>{noise}</ul></div></body></html>'
+    )
+
+def synthetic_main_list_page(n_links):
+    """A 'Lists_of_celebrities'-like page linking to n_links sub-lists."""
+    items = "".join(f'<li><a href="/wiki/List_of_group_{i}">Group {i}</a></li>' for i in range(n_links))
+    return f'<html><body><div class="mw-parser-output"><ul>{items}</ul></div></body></html>'
+
+def synthetic_recently_added_page(n_rows, seed=0):
+    """A CoinGecko-like Recently Added page with n_rows coins in the table."""
+    rng = random.Random(seed)
+    rows = "".join(
+        '<tr><td>{i}</td><td><a class="tw-flex tw-items-center" href="/en/coins/coin-{i}">'
+        '<img src="x.png"><span class="tw-hidden lg:tw-flex">{name}</span>'
+        '<span class="tw-text-gray-500">C{i}</span></a></td><td>$0.01</td><td>1h</td></tr>'
+        .format(i=i, name=synthetic_name(rng))
+        for i in range(n_rows)
+    )
+    header = "".join(f'<a href="/en/nav/{i}">Nav {i}</a>' for i in range(n_rows))
+    return (
+        f"<html><head><title>Recently Added</title></head><body><header>{header}</header>"
+        '<div class="table-scrollable"><table><thead><tr><th>#</th><th>Coin</th></tr></thead>'
+        f"<tbody>{rows}</tbody></table></div><footer>{header}</footer></body></html>"
+    )
+
+def synthetic_markets(n_coins, seed=0):
+    rng = random.Random(seed)
+    return [
+        {"id": f"coin-{i}", "symbol": f"c{i}", "name": synthetic_name(rng), "current_price": 1.0}
+        for i in range(n_coins)
+    ]
+
+def synthetic_coin_detail(seed=0):
+    return {"id": "coin", "description": {"en": synthetic_description(2000, seed)}}
+
+# -------------------------------------------------
+# Fixtures
+# -------------------------------------------------
+
+def load_fixture(fixtures_dir, filename, synthetic):
+    """
+    Return (content, source) for a recorded fixture, or the synthetic
+    fallback when it hasn't been recorded. JSON fixtures are decoded.
+    """
+    path = os.path.join(fixtures_dir, filename)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        if filename.endswith(".json"):
+            content = json.loads(content)
+        return content, "recorded"
+    return synthetic(), "synthetic"
+
+def record_fixtures(fixtures_dir, wiki_page):
+    """Fetch live pages once and save them as benchmark fixtures."""
+    import requests
+    import CelebCoinSentry as sentry
+    import CelebCoinSentry_WikiScraper as scraper
+
+    os.makedirs(fixtures_dir, exist_ok=True)
+    targets = [
+        ("recently_added.html", sentry.COINGECKO_RECENTLY_ADDED_URL, sentry.build_headers()),
+        ("markets.json", f"{sentry.COINGECKO_API_URL}&per_page=250&page=1", sentry.build_headers()),
+        ("coin.json", sentry.COINGECKO_COIN_URL.format(coin_id="dogecoin"), sentry.build_headers()),
+        ("wiki_main.html", f"{scraper.BASE_WIKIPEDIA_URL}/wiki/{scraper.MAIN_PAGE_TITLE}",
+         {"User-Agent": scraper.CRAWL_USER_AGENT}),
+        ("wiki_list.html", f"{scraper.BASE_WIKIPEDIA_URL}/wiki/{wiki_page}",
+         {"User-Agent": scraper.CRAWL_USER_AGENT}),
+    ]
+    for filename, url, headers in targets:
+        try:
+            response = requests.get(url, headers=headers, timeout=30)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"[WARN] Could not record {filename}: {e}", file=sys.stderr)
+            continue
+        with open(os.path.join(fixtures_dir, filename), "w", encoding="utf-8") as f:
+            f.write(response.text)
+        print(f"[INFO] Recorded {filename} ({len(response.content)} bytes).", file=sys.stderr)
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+
+def time_call(fn, repeat):
+    """Best and mean wall time of fn() over `repeat` runs (stdout silenced)."""
+    timings = []
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - started)
+    return min(timings), sum(timings) / len(timings)
+
+@contextlib.contextmanager
+def working_directory(path):
+    """Run with cwd=path; the scripts keep their state files relative to cwd."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+def result(suite, name, seconds, **extra):
+    """One benchmark result; `seconds` is the metric `compare` tracks."""
+    entry = {"suite": suite, "name": name, "seconds": seconds}
+    entry.update(extra)
+    return entry
+
+# -------------------------------------------------
+# Parser Benchmark
+# -------------------------------------------------
+
+PARSER_KINDS = {
+    "list": extract_list_item_links,
+    "coins": extract_recently_added_rows,
+}
+
+def _peak_rss_kib():
+    """High-water RSS of this process in KiB, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def _run_parser(backend, kind, html, repeat):
+    """
+    Time one backend and measure its memory. Runs in a fresh child process
+    so RSS high-water marks from other backends don't leak in.
+    """
+    extract = PARSER_KINDS[kind]
+    extract(html, backend)  # warm-up (imports, caches)
+
+    rss_before = _peak_rss_kib()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = extract(html, backend)
+        timings.append(time.perf_counter() - started)
+    rss_after = _peak_rss_kib()
+
+    tracemalloc.start()
+    extract(html, backend)
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result(
+        "parsers", f"parsers/{kind}/{backend}", min(timings),
+        backend=backend,
+        kind=kind,
+        items=len(rows or []),
+        mean_seconds=sum(timings) / len(timings),
+        python_peak_bytes=py_peak,
+        rss_growth_kib=None if rss_before is None else rss_after - rss_before,
+    )
+
+def _run_parser_child(args, queue):
+    queue.put(_run_parser(*args))
+
+def bench_parsers(kind, html, repeat=5, backends=None):
+    """
+    Benchmark every extraction backend on the same HTML.
+    Returns a list of result dicts (one per backend).
+    """
+    if backends is None:
+        backends = [b for b in BACKENDS if b != "lxml" or lxml is not None]
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for backend in backends:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run_parser_child, args=((backend, kind, html, repeat), queue))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+    return results
+
+def bench_parser_fixtures(fixtures_dir, repeat=5, backends=None):
+    """Parser benchmark on the recorded list page and Recently Added page."""
+    results = []
+    for kind, filename, synthetic in (
+        ("list", "wiki_list.html", lambda: synthetic_list_page(5000)),
+        ("coins", "recently_added.html", lambda: synthetic_recently_added_page(300)),
+    ):
+        html, source = load_fixture(fixtures_dir, filename, synthetic)
+        for entry in bench_parsers(kind, html, repeat, backends):
+            entry["fixture"] = source
+            entry["input_bytes"] = len(html)
+            results.append(entry)
+    return results
+
+# -------------------------------------------------
+# Matching Benchmark
+# -------------------------------------------------
+
+def bench_matching(name_counts=MATCH_NAME_COUNTS, description_lengths=MATCH_DESCRIPTION_LENGTHS,
+                   repeat=5):
+    """
+    Time matcher build, debug_partial_celeb_check and is_celebrity_coin
+    against synthetic name lists of each size and descriptions of each length.
+    """
+    import CelebCoinSentry as sentry
+    from CelebCoinSentry_Matcher import build_matcher
+
+    results = []
+    for n_names in name_counts:
+        names = synthetic_names(n_names)
+        started = time.perf_counter()
+        matcher = build_matcher(names)
+        results.append(result("matching", f"matching/build/{n_names}",
+                              time.perf_counter() - started, names=n_names))
+
+        sentry.CELEBRITY_NAMES = names
+        sentry.CELEBRITY_MATCHER = matcher
+        best, mean = time_call(lambda: sentry.debug_partial_celeb_check("Taylor Swift Inu", "TSWIFT"),
+                               repeat * 20)
+        results.append(result("matching", f"matching/partial/{n_names}", best,
+                              names=n_names, mean_seconds=mean))
+
+        for length in description_lengths:
+            description = synthetic_description(length)
+            best, mean = time_call(
+                lambda: sentry.is_celebrity_coin("Taylor Swift Inu", "TSWIFT", description), repeat
+            )
+            results.append(result("matching", f"matching/final/{n_names}/{length}", best,
+                                  names=n_names, description_chars=length, mean_seconds=mean))
+    return results
+
+# -------------------------------------------------
+# Load Benchmark
+# -------------------------------------------------
+
+def bench_loading(sizes=LOAD_SIZES, repeat=3):
+    """
+    Time load_celebrity_names (cold: builds the matcher cache; warm: maps
+    it) and load_alerted_coins (journal replay) at each size.
+    """
+    import CelebCoinSentry as sentry
+
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp, working_directory(tmp):
+            with open(sentry.CELEBRITY_NAMES_FILE, "w", encoding="utf-8") as f:
+                f.write("\n".join(synthetic_names(size)) + "\n")
+            with open(sentry.ALERTED_COINS_FILE, "w", encoding="utf-8") as f:
+                for i in range(size):
+                    f.write(json.dumps({"id": f"coin-{i}", "ts": 0, "celebrities": ["x"]}) + "\n")
+
+            def cold_load():
+                if os.path.exists(sentry.CELEBRITY_MATCHER_CACHE_FILE):
+                    os.remove(sentry.CELEBRITY_MATCHER_CACHE_FILE)
+                sentry.load_celebrity_names()
+
+            best, mean = time_call(cold_load, repeat)
+            results.append(result("loading", f"loading/names_cold/{size}", best,
+                                  size=size, mean_seconds=mean))
+            best, mean = time_call(sentry.load_celebrity_names, repeat)
+            results.append(result("loading", f"loading/names_warm/{size}", best,
+                                  size=size, mean_seconds=mean))
+            best, mean = time_call(sentry.load_alerted_coins, repeat)
+            results.append(result("loading", f"loading/alerted_coins/{size}", best,
+                                  size=size, mean_seconds=mean))
+            sentry.CELEBRITY_MATCHER = sentry.build_matcher([])
+            sentry.CELEBRITY_NAMES = set()
+    return results
+
+# -------------------------------------------------
+# Stand-in HTTP Server
+# -------------------------------------------------
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Serves recorded (or synthetic) CoinGecko and Wikipedia responses,
+    and accepts Discord webhook posts.
+    """
+    fixtures = {}
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data):
+        self._send(200, json.dumps(data).encode("utf-8"))
+
+    def _send_html(self, html):
+        self._send(200, html.encode("utf-8"), "text/html; charset=utf-8")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        fx = self.fixtures
+        if url.path == "/en/coins/recently_added":
+            self._send_html(fx["recently_added"])
+        elif url.path == "/api/v3/coins/markets":
+            page = int(query.get("page", ["1"])[0])
+            self._send_json(fx["markets"] if page == 1 else [])
+        elif url.path == "/api/v3/coins/list":
+            self._send_json([{"id": c["id"], "symbol": c["symbol"], "name": c["name"]}
+                             for c in fx["markets"]])
+        elif url.path.startswith("/api/v3/coins/"):
+            self._send_json(fx["coin"])
+        elif url.path == "/w/api.php":
+            titles = query.get("titles", [""])[0].split("|")
+            pages = [{"title": t, "revisions": [{"revid": 1}]} for t in titles if t]
+            self._send_json({"query": {"pages": pages}})
+        elif url.path == "/wiki/Lists_of_celebrities":
+            self._send_html(fx["wiki_main"])
+        elif url.path.startswith("/wiki/"):
+            self._send_html(fx["wiki_list"])
+        else:
+            self._send(404)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send(204)
+
+@contextlib.contextmanager
+def stand_in_server(fixtures):
+    """Run the stand-in server on a free local port; yields its base URL."""
+    handler = type("Handler", (StandInHandler,), {"fixtures": fixtures})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def load_stand_in_fixtures(fixtures_dir):
+    """All fixtures the stand-in serves, plus where each came from."""
+    specs = {
+        "recently_added": ("recently_added.html", lambda: synthetic_recently_added_page(100)),
+        "markets": ("markets.json", lambda: synthetic_markets(250)),
+        "coin": ("coin.json", synthetic_coin_detail),
+        "wiki_main": ("wiki_main.html", lambda: synthetic_main_list_page(50)),
+        "wiki_list": ("wiki_list.html", lambda: synthetic_list_page(2000)),
+    }
+    fixtures, sources = {}, {}
+    for key, (filename, synthetic) in specs.items():
+        fixtures[key], sources[key] = load_fixture(fixtures_dir, filename, synthetic)
+    return fixtures, sources
+
+# -------------------------------------------------
+# Full Cycle Benchmark
+# -------------------------------------------------
+
+def bench_cycles(fixtures_dir, n_names=10000, repeat=3):
+    """
+    Run complete sentry cycles (Recently Added and /markets modes) and a
+    full Wiki scrape against the stand-in server, from a temp directory.
+    """
+    import CelebCoinSentry as sentry
+    import CelebCoinSentry_WikiScraper as scraper
+
+    fixtures, sources = load_stand_in_fixtures(fixtures_dir)
+    names = synthetic_names(n_names, seed=1)  # different seed from the served coins
+    # Make some coins in the served data match, so alert delivery is exercised.
+    names += [coin["name"] for coin in fixtures["markets"][:5]]
+
+    results = []
+    with stand_in_server(fixtures) as base, tempfile.TemporaryDirectory() as tmp, \
+            working_directory(tmp):
+        sentry.COINGECKO_RECENTLY_ADDED_URL = f"{base}/en/coins/recently_added"
+        sentry.COINGECKO_API_URL = f"{base}/api/v3/coins/markets?vs_currency=usd"
+        sentry.COINGECKO_COIN_URL = base + "/api/v3/coins/{coin_id}"
+        sentry.COINGECKO_COINS_LIST_URL = f"{base}/api/v3/coins/list"
+        sentry.DISCORD_WEBHOOK_URL = f"{base}/discord"
+        sentry.ALERT_METHOD = "discord"
+        sentry.COINGECKO_CALLS_PER_MINUTE = 10 ** 6
+        sentry.COINGECKO_BURST = 10 ** 6
+        sentry._RATE_TOKENS = float(sentry.COINGECKO_BURST)
+        sentry.MARKETS_SCAN_PAGES = 2
+
+        with open(sentry.CELEBRITY_NAMES_FILE, "w", encoding="utf-8") as f:
+            f.write("\n".join(names) + "\n")
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            sentry.load_celebrity_names()
+
+        for mode, scrape_html in (("recently_added", True), ("markets", False)):
+            sentry.SCRAPE_RECENTLY_ADDED = scrape_html
+
+            def cycle():
+                # Fresh state each run, so every run does the full work.
+                for path in os.listdir("."):
+                    if path not in (sentry.CELEBRITY_NAMES_FILE, sentry.CELEBRITY_MATCHER_CACHE_FILE):
+                        os.remove(path)
+                sentry._CACHE_CONN = None
+                sentry.ALERTED_COIN_IDS.clear()
+                sentry.CLEARED_COIN_IDS.clear()
+                summary = sentry.run_cycle()
+                sentry.ALERT_QUEUE.join()
+                return summary
+
+            best, mean = time_call(cycle, repeat)
+            results.append(result("cycle", f"cycle/{mode}", best, mean_seconds=mean,
+                                  names=len(names), fixtures=sources))
+
+        scraper.WIKIPEDIA_API_URL = f"{base}/w/api.php"
+        scraper.BASE_WIKIPEDIA_URL = base
+        scraper.CRAWL_MAX_REQUESTS_PER_SECOND = 10 ** 6
+
+        def wiki_refresh():
+            names = scraper.refresh_celebrity_names({"main_revid": None, "subpages": {}}, {})
+            if names:
+                names = scraper.normalize_name_corpus(names)[0]
+            scraper.save_celebrity_names_to_file(names or set())
+
+        best, mean = time_call(wiki_refresh, repeat)
+        results.append(result("cycle", "cycle/wiki_refresh", best, mean_seconds=mean,
+                              fixtures=sources))
+    return results
+
+# -------------------------------------------------
+# Reports
+# -------------------------------------------------
+
+def build_report(results):
+    return {
+        "tool": SCRIPT_NAME,
+        "version": VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+def compare_reports(baseline, current, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare `seconds` per result name between two reports.
+    Returns a list of rows; rows with regression=True are >threshold slower.
+    """
+    before = {r["name"]: r["seconds"] for r in baseline["results"]}
+    rows = []
+    for entry in current["results"]:
+        old = before.get(entry["name"])
+        if old is None or old <= 0:
+            continue
+        ratio = entry["seconds"] / old
+        rows.append({
+            "name": entry["name"],
+            "baseline_seconds": old,
+            "seconds": entry["seconds"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+
+SUITES = ("parsers", "matching", "loading", "cycle")
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="CelebCoinSentry benchmarks (JSON output).")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("parsers", help="HTML extraction backends: parse time and peak memory.")
+    p.add_argument("--kind", choices=sorted(PARSER_KINDS), default="list")
+    p.add_argument("--html-file", help="Saved HTML page (default: synthetic page).")
+    p.add_argument("--size", type=int, default=5000, help="Items in the synthetic page.")
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--backend", action="append", choices=BACKENDS,
+                   help="Backend to run (repeatable; default: all available).")
+    p.add_argument("--output", help="Write the JSON report here instead of stdout.")
+
+    p = sub.add_parser("run", help="Run benchmark suites and emit a JSON report.")
+    p.add_argument("--suite", action="append", choices=SUITES,
+                   help="Suite to run (repeatable; default: all).")
+    p.add_argument("--fixtures-dir", default=FIXTURES_DIR)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--quick", action="store_true", help="Smaller sizes for a fast smoke run.")
+    p.add_argument("--output", help="Write the JSON report here instead of stdout.")
+
+    p = sub.add_parser("record", help="Save live CoinGecko/Wikipedia responses as fixtures.")
+    p.add_argument("--fixtures-dir", default=FIXTURES_DIR)
+    p.add_argument("--wiki-page", default="List_of_American_film_actresses")
+
+    p = sub.add_parser("compare", help="Compare two reports; exit 1 on regressions.")
+    p.add_argument("baseline")
+    p.add_argument("current")
+    p.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    return parser
+
+def write_report(report, output=None):
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == "parsers":
+        if args.html_file:
+            with open(args.html_file, "r", encoding="utf-8") as f:
+                html = f.read()
+        elif args.kind == "list":
+            html = synthetic_list_page(args.size)
+        else:
+            html = synthetic_recently_added_page(args.size)
+        report = build_report(bench_parsers(args.kind, html, args.repeat, args.backend))
+        report["input_bytes"] = len(html)
+        write_report(report, args.output)
+        return 0
+
+    if args.command == "run":
+        suites = args.suite or SUITES
+        results = []
+        if "parsers" in suites:
+            results += bench_parser_fixtures(args.fixtures_dir, args.repeat)
+        if "matching" in suites:
+            if args.quick:
+                results += bench_matching((1000,), (0, 1000), args.repeat)
+            else:
+                results += bench_matching(repeat=args.repeat)
+        if "loading" in suites:
+            results += bench_loading((1000,) if args.quick else LOAD_SIZES, args.repeat)
+        if "cycle" in suites:
+            results += bench_cycles(args.fixtures_dir, 1000 if args.quick else 10000, args.repeat)
+        write_report(build_report(results), args.output)
+        return 0
+
+    if args.command == "record":
+        record_fixtures(args.fixtures_dir, args.wiki_page)
+        return 0
+
+    if args.command == "compare":
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.current, "r", encoding="utf-8") as f:
+            current = json.load(f)
+        rows = compare_reports(baseline, current, args.threshold)
+        json.dump({"threshold": args.threshold, "comparisons": rows}, sys.stdout, indent=2)
+        print()
+        return 1 if any(row["regression"] for row in rows) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+import os
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+from collections import deque
+
+from CelebCoinSentry_Matcher import find_matches, load_or_build_matcher, matched_names
+
+# -------------------------------------------------
+# CelebCoinSentry Bulk Scan Metadata
+# -------------------------------------------------
+SCRIPT_NAME = "CelebCoinSentry_BulkScan"
+AUTHOR_NAME = "rnvntr"
+VERSION = "1.0.0"
+
+# -------------------------------------------------
+# Defaults
+# -------------------------------------------------
+CELEBRITY_NAMES_FILE = "CelebCoinSentry_celebrity_names.txt"
+CELEBRITY_MATCHER_CACHE_FILE = "CelebCoinSentry_celebrity_matcher.bin"
+
+CHUNK_SIZE = 2000  # records per task sent to a worker
+PROGRESS_EVERY = 5  # seconds between progress lines
+
+# -------------------------------------------------
+# Worker
+# -------------------------------------------------
+
+_WORKER_MATCHER = None
+
+def init_worker(names_file, cache_file):
+    """
+    Pool initializer: load the matcher once per worker process.
+    Workers share the mmap'd matcher cache, so this is cheap after the first.
+    """
+    global _WORKER_MATCHER
+    _WORKER_MATCHER, _ = load_or_build_matcher(names_file, cache_file)
+
+def coin_description(record):
+    """CoinGecko dumps store description as {'en': ...}; plain strings work too."""
+    description = record.get("description") or ""
+    if isinstance(description, dict):
+        description = description.get("en") or ""
+    return description
+
+def scan_record(record):
+    """
+    Run both detection stages on one coin record, as the sentry does: only
+    coins whose name/symbol pass the partial check have their description
+    looked at, so only those can match.
+    Returns (output dict or None, description_only) where description_only
+    is True for coins matched by their description alone (the sentry would
+    never fetch it, so they are counted but not reported).
+    """
+    name = record.get("name") or ""
+    symbol = record.get("symbol") or ""
+    partial = find_matches(_WORKER_MATCHER, f"{name} {symbol}")
+    hits = find_matches(_WORKER_MATCHER, f"{name} {symbol} {coin_description(record)}")
+    if not hits:
+        return None, False
+    if not partial:
+        return None, True
+    return {
+        "id": record.get("id"),
+        "name": name,
+        "symbol": symbol,
+        "partial": matched_names(partial),
+        "celebrities": matched_names(hits),
+        "hits": [{"name": celeb, "start": start, "end": end} for start, end, celeb in hits],
+    }, False
+
+def scan_chunk(lines):
+    """
+    Parse and scan a chunk of JSONL lines.
+    Returns (output lines, records scanned, bad lines, description-only hits).
+    """
+    out = []
+    scanned = 0
+    bad = 0
+    description_only = 0
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            bad += 1
+            continue
+        if not isinstance(record, dict):
+            bad += 1
+            continue
+        scanned += 1
+        result, only_description = scan_record(record)
+        if result is not None:
+            out.append(json.dumps(result, ensure_ascii=False))
+        description_only += only_description
+    return out, scanned, bad, description_only
+
+# -------------------------------------------------
+# Driver
+# -------------------------------------------------
+
+def iter_chunks(f, chunk_size):
+    """Yield lists of non-empty lines from a text file."""
+    chunk = []
+    for line in f:
+        if line.strip():
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+def bulk_scan(input_path, output_path, names_file=CELEBRITY_NAMES_FILE,
+              cache_file=CELEBRITY_MATCHER_CACHE_FILE, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Stream input_path (JSONL coin records) through a process pool and write
+    matches to output_path as JSONL, in input order.
+    At most 2 * workers chunks are in flight, so memory stays bounded.
+    Returns a stats dict.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    # Build/refresh the matcher cache once up front so workers just map it.
+    load_or_build_matcher(names_file, cache_file)
+
+    stats = {"records": 0, "matches": 0, "description_only": 0, "bad_lines": 0,
+             "seconds": 0.0, "workers": workers}
+    started = time.monotonic()
+    last_report = started
+
+    def collect(result, out):
+        nonlocal last_report
+        lines, scanned, bad, description_only = result.get()
+        for line in lines:
+            out.write(line + "\n")
+        stats["records"] += scanned
+        stats["matches"] += len(lines)
+        stats["bad_lines"] += bad
+        stats["description_only"] += description_only
+        now = time.monotonic()
+        if now - last_report >= PROGRESS_EVERY:
+            last_report = now
+            rate = stats["records"] / (now - started)
+            print(f"[INFO] {stats['records']} records, {stats['matches']} matches "
+                  f"({rate:.0f} records/s)", file=sys.stderr)
+
+    with multiprocessing.Pool(workers, initializer=init_worker,
+                              initargs=(names_file, cache_file)) as pool, \
+            open(input_path, "r", encoding="utf-8") as inp, \
+            open(output_path, "w", encoding="utf-8") as out:
+        in_flight = deque()
+        for chunk in iter_chunks(inp, chunk_size):
+            in_flight.append(pool.apply_async(scan_chunk, (chunk,)))
+            if len(in_flight) >= 2 * workers:
+                collect(in_flight.popleft(), out)
+        while in_flight:
+            collect(in_flight.popleft(), out)
+
+    stats["seconds"] = time.monotonic() - started
+    stats["records_per_second"] = stats["records"] / max(stats["seconds"], 1e-9)
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run the celebrity matcher over a JSONL dump of coin records."
+    )
+    parser.add_argument("input", help="JSONL file, one coin per line (id, name, symbol, description).")
+    parser.add_argument("output", help="JSONL file to write matches to.")
+    parser.add_argument("--names-file", default=CELEBRITY_NAMES_FILE)
+    parser.add_argument("--cache-file", default=CELEBRITY_MATCHER_CACHE_FILE)
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all cores).")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.names_file):
+        print(f"[ERROR] {args.names_file} not found.", file=sys.stderr)
+        return 1
+
+    print(f"[INFO] {SCRIPT_NAME} v{VERSION} by {AUTHOR_NAME} started.", file=sys.stderr)
+    stats = bulk_scan(args.input, args.output, args.names_file, args.cache_file,
+                      args.workers, args.chunk_size)
+    print(f"[INFO] Scanned {stats['records']} records in {stats['seconds']:.1f}s "
+          f"({stats['records_per_second']:.0f} records/s), {stats['matches']} matches, "
+          f"{stats['description_only']} description-only hits (not reported), "
+          f"{stats['bad_lines']} bad lines.", file=sys.stderr)
+    print(json.dumps(stats))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+import sys
+import random
+import asyncio
+import argparse
+
+import CelebCoinSentry as sentry
+import CelebCoinSentry_Metrics as metrics
+import CelebCoinSentry_Profiler as profiling
+import CelebCoinSentry_WikiScraper as scraper
+
+# -------------------------------------------------
+# CelebCoinSentry Daemon Metadata
+# -------------------------------------------------
+SCRIPT_NAME = "CelebCoinSentry_Daemon"
+AUTHOR_NAME = "rnvntr"
+VERSION = "1.0.0"
+
+# -------------------------------------------------
+# Configuration
+# -------------------------------------------------
+#
+# Runs the Wiki Scraper and the sentry in one process, as asyncio tasks:
+#   scrape  - every scraper.SCRAPE_INTERVAL; a changed list is handed to the
+#             sentry's matcher straight away (no file polling needed)
+#   coins   - every sentry.CHECK_INTERVAL (fetch, partial check,
+#             descriptions, final check)
+#   names   - every sentry.NAMES_RELOAD_CHECK_INTERVAL, picks up manual
+#             edits of the names file
+# Alerts are delivered by the sentry's background dispatcher as usual.
+# Profiling triggers work as in the standalone scripts: sentry.PROFILE_SIGNAL
+# captures the next coin cycle, scraper.PROFILE_SIGNAL the next scrape.
+# The blocking work runs on the default thread pool, so a long Wiki crawl
+# never delays a coin poll.
+
+# Each run starts on its own cadence, shifted by up to +/- SCHEDULE_JITTER
+# of the interval. If the previous run of a task is still going when its
+# next one is due, that run is skipped rather than stacked.
+SCHEDULE_JITTER = 0.1
+
+# -------------------------------------------------
+# Scheduling
+# -------------------------------------------------
+
+async def run_task_once(name, func, on_result=None):
+    """Run a blocking task on the thread pool, logging instead of raising."""
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(None, func)
+    except Exception as e:
+        print(f"[ERROR] Task '{name}' failed: {e}")
+        return None
+    if on_result is not None:
+        on_result(result)
+    return result
+
+async def run_periodic(name, func, interval, on_result=None):
+    """
+    Start func every `interval` seconds (with jitter), forever.
+    Never runs two copies of the same task at once.
+    """
+    running = None
+    while True:
+        if running is not None and not running.done():
+            print(f"[WARN] Task '{name}' is still running. Skipping this run.")
+            metrics.inc("skipped_runs_total", task=name)
+        else:
+            running = asyncio.create_task(run_task_once(name, func, on_result))
+        await asyncio.sleep(interval * random.uniform(1 - SCHEDULE_JITTER, 1 + SCHEDULE_JITTER))
+
+def scrape_and_reload():
+    """One Wiki update check; stage the new names for the sentry if they changed."""
+    summary = scraper.run_scrape()
+    if summary["changed"]:
+        sentry.stage_celebrity_names_reload()
+    return summary
+
+def daemon_tasks():
+    """(name, func, interval, on_result) for every scheduled task."""
+    tasks = [
+        ("scrape", scrape_and_reload, scraper.SCRAPE_INTERVAL, scraper.log_scrape_summary),
+        ("coins", sentry.run_cycle, sentry.CHECK_INTERVAL, sentry.log_cycle_summary),
+    ]
+    if sentry.NAMES_RELOAD_CHECK_INTERVAL:
+        tasks.append(("names", sentry.stage_celebrity_names_reload,
+                      sentry.NAMES_RELOAD_CHECK_INTERVAL, None))
+    return tasks
+
+# -------------------------------------------------
+# Main
+# -------------------------------------------------
+
+async def run_daemon(once=False):
+    sentry.load_celebrity_names()
+    sentry.load_alerted_coins()
+    sentry.start_alert_dispatcher()
+    metrics.start_metrics_server(sentry.METRICS_PORT, sentry.METRICS_HOST)
+
+    if once:
+        # A scrape first, so the single poll matches against fresh names.
+        await run_task_once("scrape", scrape_and_reload, scraper.log_scrape_summary)
+        await run_task_once("coins", sentry.run_cycle, sentry.log_cycle_summary)
+        await asyncio.get_running_loop().run_in_executor(None, sentry.ALERT_QUEUE.join)
+        return
+
+    await asyncio.gather(*(
+        run_periodic(name, func, interval, on_result)
+        for name, func, interval, on_result in daemon_tasks()
+    ))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run the Wiki Scraper and the coin sentry in one process."
+    )
+    parser.add_argument("--once", action="store_true",
+                        help="Run one scrape and one coin cycle, deliver alerts, then exit.")
+    args = parser.parse_args(argv)
+
+    print(f"[INFO] {SCRIPT_NAME} v{VERSION} by {AUTHOR_NAME} started.")
+    profiling.install_signal_trigger("sentry", sentry.PROFILE_SIGNAL)
+    profiling.install_signal_trigger("scraper", scraper.PROFILE_SIGNAL)
+    for name, _, interval, _ in daemon_tasks():
+        print(f"[INFO] Task '{name}' every {interval} seconds (+/- {SCHEDULE_JITTER:.0%}).")
+    try:
+        asyncio.run(run_daemon(args.once))
+    except KeyboardInterrupt:
+        print("[INFO] Stopped.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
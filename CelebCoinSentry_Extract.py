@@ -0,0 +1,173 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+except ImportError:  # lxml is optional; the BeautifulSoup backends cover it
+    lxml = None
+
+# -------------------------------------------------
+# CelebCoinSentry Extract Metadata
+# -------------------------------------------------
+SCRIPT_NAME = "CelebCoinSentry_Extract"
+AUTHOR_NAME = "rnvntr"
+VERSION = "1.0.0"
+
+# -------------------------------------------------
+# Backends
+# -------------------------------------------------
+#
+# "lxml"     - lxml.html + XPath (fastest; needs `pip install lxml`)
+# "strainer" - BeautifulSoup that only builds the nodes we read (SoupStrainer)
+# "bs4"      - the original full BeautifulSoup tree with html.parser
+# "auto"     - lxml if installed, else strainer
+
+BACKENDS = ("lxml", "strainer", "bs4")
+
+def resolve_backend(backend="auto"):
+    """Pick a concrete backend name, falling back when lxml isn't installed."""
+    if backend == "auto":
+        return "lxml" if lxml is not None else "strainer"
+    if backend == "lxml" and lxml is None:
+        print("[WARN] lxml not installed. Falling back to the 'strainer' backend.")
+        return "strainer"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {backend}")
+    return backend
+
+def _xpath_class(cls):
+    """XPath predicate matching one class token (like CSS '.cls')."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+# -------------------------------------------------
+# Wikipedia list items
+# -------------------------------------------------
+
+def extract_list_item_links(html, backend="auto"):
+    """
+    For each <li> inside the first div.mw-parser-output, take the first
+    <a href> and return it as (href, text).
+    """
+    backend = resolve_backend(backend)
+    if backend == "lxml":
+        return _list_item_links_lxml(html)
+
+    if backend == "strainer":
+        only_content = SoupStrainer("div", class_="mw-parser-output")
+        soup = BeautifulSoup(html, "html.parser", parse_only=only_content)
+    else:
+        soup = BeautifulSoup(html, "html.parser")
+    content_div = soup.find("div", {"class": "mw-parser-output"})
+    if not content_div:
+        return []
+
+    links = []
+    for li in content_div.find_all("li"):
+        a_tag = li.find("a", href=True)
+        if a_tag:
+            links.append((a_tag["href"], a_tag.get_text().strip()))
+    return links
+
+def _list_item_links_lxml(html):
+    if not html.strip():
+        return []
+    root = lxml.html.fromstring(html)
+    content_divs = root.xpath(f"//div[{_xpath_class('mw-parser-output')}]")
+    if not content_divs:
+        return []
+
+    links = []
+    for li in content_divs[0].iter("li"):
+        anchors = li.xpath("(.//a[@href])[1]")
+        if anchors:
+            links.append((anchors[0].get("href"), anchors[0].text_content().strip()))
+    return links
+
+# -------------------------------------------------
+# CoinGecko "Recently Added" table
+# -------------------------------------------------
+
+def extract_recently_added_rows(html, backend="auto", stop_before=None):
+    """
+    Read the rows of the Recently Added coins table.
+    If stop_before(href) is true for a row, reading stops there (the table
+    is newest-first, so everything below was already seen).
+    Returns a list of (href, name, symbol) tuples, in table order,
+    or None if the table couldn't be found.
+    """
+    backend = resolve_backend(backend)
+    if backend == "lxml":
+        return _recently_added_rows_lxml(html, stop_before)
+
+    if backend == "strainer":
+        only_table = SoupStrainer(class_="table-scrollable")
+        soup = BeautifulSoup(html, "html.parser", parse_only=only_table)
+    else:
+        soup = BeautifulSoup(html, "html.parser")
+
+    # The table of recently added coins is typically .table-scrollable > table > tbody
+    table_body = soup.select_one(".table-scrollable table tbody")
+    if not table_body:
+        return None
+
+    rows = []
+    for row in table_body.find_all("tr"):
+        cols = row.find_all("td")
+        if not cols or len(cols) < 2:
+            continue
+
+        anchor = row.select_one("a.tw-flex")
+        if not anchor:
+            continue
+
+        name_span = anchor.select_one("span.tw-hidden")
+        if not name_span:
+            continue
+
+        symbol_span = name_span.find_next_sibling("span")
+        if not symbol_span:
+            continue
+
+        href = anchor.get("href", "")
+        if stop_before is not None and stop_before(href):
+            break
+        rows.append((
+            href,
+            name_span.get_text(strip=True),
+            symbol_span.get_text(strip=True),
+        ))
+    return rows
+
+def _recently_added_rows_lxml(html, stop_before=None):
+    if not html.strip():
+        return None
+    root = lxml.html.fromstring(html)
+    bodies = root.xpath(f"(//*[{_xpath_class('table-scrollable')}]//table//tbody)[1]")
+    if not bodies:
+        return None
+
+    rows = []
+    for row in bodies[0].iter("tr"):
+        if len(row.xpath(".//td")) < 2:
+            continue
+
+        anchors = row.xpath(f"(.//a[{_xpath_class('tw-flex')}])[1]")
+        if not anchors:
+            continue
+
+        name_spans = anchors[0].xpath(f"(.//span[{_xpath_class('tw-hidden')}])[1]")
+        if not name_spans:
+            continue
+
+        symbol_spans = name_spans[0].xpath("following-sibling::span[1]")
+        if not symbol_spans:
+            continue
+
+        href = anchors[0].get("href", "")
+        if stop_before is not None and stop_before(href):
+            break
+        rows.append((
+            href,
+            name_spans[0].text_content().strip(),
+            symbol_spans[0].text_content().strip(),
+        ))
+    return rows
@@ -0,0 +1,322 @@
+import json
+import time
+import sqlite3
+import threading
+import requests
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.request import ACCEPT_ENCODING
+
+import CelebCoinSentry_Metrics as metrics
+
+# -------------------------------------------------
+# CelebCoinSentry HTTP Client Metadata
+# -------------------------------------------------
+SCRIPT_NAME = "CelebCoinSentry_Http"
+AUTHOR_NAME = "rnvntr"
+VERSION = "1.0.0"
+
+# -------------------------------------------------
+# Configuration
+# -------------------------------------------------
+#
+# Every CoinGecko, Discord and Wikipedia request goes through one shared
+# requests.Session, so connections (and TLS sessions) are kept alive and
+# reused per host across calls and threads.
+
+# Keep-alive pools: hosts with a pool, and connections kept per host
+# (raise HTTP_POOL_MAXSIZE above the largest worker count hitting one host).
+HTTP_POOL_HOSTS = 10
+HTTP_POOL_MAXSIZE = 16
+
+# Default (connect, read) timeouts in seconds, used unless a call passes one.
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 20
+
+# Optional private HTTP cache (SQLite) for GET responses, following the
+# response's Cache-Control / Expires / Vary headers and revalidating with
+# ETag / Last-Modified. None disables it.
+HTTP_CACHE_FILE = None
+HTTP_CACHE_HEURISTIC_MAX = 86400  # cap on heuristic freshness (10% of Last-Modified age)
+
+# gzip/deflate always; br (and zstd) too when urllib3 can decode them.
+ACCEPT_ENCODING_HEADER = ACCEPT_ENCODING
+
+# -------------------------------------------------
+# Session and Stats
+# -------------------------------------------------
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_STATS_LOCK = threading.Lock()
+_STATS = {
+    "requests": 0,
+    "connections_opened": 0,
+    "bytes_wire": 0,
+    "bytes_body": 0,
+    "cache_hits": 0,
+    "cache_revalidated": 0,
+}
+_POOL_CONNECTIONS = {}  # host -> connections opened by its pool so far
+
+def get_session():
+    """Return the shared session, creating it (and its pools) on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Accept-Encoding"] = ACCEPT_ENCODING_HEADER
+            _SESSION = session
+        return _SESSION
+
+def host_of(url):
+    """'https://host:port/path' -> 'host:port'."""
+    return url.split("://", 1)[-1].split("/", 1)[0]
+
+def _record_transfer(response):
+    """Count bytes (on the wire and decoded) and newly opened connections."""
+    host = host_of(response.url)
+    body = len(response.content)
+    try:
+        wire = response.raw.tell() or body
+    except (AttributeError, OSError):
+        wire = body
+
+    # urllib3 counts connections per pool; sum the pools serving this host.
+    opened = 0
+    try:
+        parts = urlsplit(response.url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        pools = get_session().get_adapter(response.url).poolmanager.pools
+        total = 0
+        for key in pools.keys():
+            if key.key_host == parts.hostname and key.key_port == port:
+                pool = pools.get(key)
+                total += pool.num_connections if pool is not None else 0
+    except (AttributeError, ValueError):
+        total = None
+
+    with _STATS_LOCK:
+        _STATS["requests"] += 1
+        _STATS["bytes_wire"] += wire
+        _STATS["bytes_body"] += body
+        if total is not None:
+            opened = max(0, total - _POOL_CONNECTIONS.get(host, 0))
+            _POOL_CONNECTIONS[host] = max(total, _POOL_CONNECTIONS.get(host, 0))
+            _STATS["connections_opened"] += opened
+    metrics.record_http_response(response.url, response.status_code)
+    metrics.inc("http_bytes_total", wire, host=host, kind="wire")
+    metrics.inc("http_bytes_total", body, host=host, kind="body")
+    if opened:
+        metrics.inc("http_connections_opened_total", opened, host=host)
+
+def http_stats():
+    """
+    Totals since start: requests, connections opened (the rest reused a
+    kept-alive connection), bytes on the wire vs. decoded, and cache use.
+    """
+    with _STATS_LOCK:
+        stats = dict(_STATS)
+    network = max(stats["requests"], 1)
+    stats["connection_reuse_ratio"] = round(1 - stats["connections_opened"] / network, 3)
+    return stats
+
+# -------------------------------------------------
+# HTTP Cache (SQLite, RFC 9111 private cache subset)
+# -------------------------------------------------
+
+_CACHE_LOCK = threading.Lock()
+_CACHE_CONN = None
+
+def _http_cache():
+    """Open (once) the HTTP cache. Caller must hold _CACHE_LOCK."""
+    global _CACHE_CONN
+    if _CACHE_CONN is None:
+        _CACHE_CONN = sqlite3.connect(HTTP_CACHE_FILE, check_same_thread=False)
+        _CACHE_CONN.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY,"
+            " status INTEGER NOT NULL,"
+            " headers TEXT NOT NULL,"
+            " body BLOB NOT NULL,"
+            " vary TEXT NOT NULL,"
+            " fresh_until REAL NOT NULL)"
+        )
+        _CACHE_CONN.commit()
+    return _CACHE_CONN
+
+def _cache_directives(value):
+    """Parse a Cache-Control header into {directive: value or True}."""
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else True
+    return directives
+
+def _http_date(value):
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+def freshness_lifetime(headers, now):
+    """
+    Seconds a response stays fresh: max-age, else Expires - Date, else 10% of
+    the time since Last-Modified (capped). 0 means revalidate before reuse.
+    """
+    directives = _cache_directives(headers.get("Cache-Control"))
+    if "no-cache" in directives:
+        return 0.0
+    if "max-age" in directives:
+        try:
+            lifetime = float(directives["max-age"])
+        except ValueError:
+            return 0.0
+        try:
+            lifetime -= float(headers.get("Age", 0))
+        except ValueError:
+            pass
+        return max(0.0, lifetime)
+    date = _http_date(headers.get("Date")) or now
+    expires = headers.get("Expires")
+    if expires is not None:
+        expires_at = _http_date(expires)
+        return max(0.0, expires_at - date) if expires_at else 0.0
+    last_modified = _http_date(headers.get("Last-Modified"))
+    if last_modified is not None:
+        return min(HTTP_CACHE_HEURISTIC_MAX, max(0.0, (date - last_modified) * 0.1))
+    return 0.0
+
+def is_cacheable(request_headers, response):
+    """Whether a GET response may be stored by a private cache."""
+    if response.status_code != 200:
+        return False
+    if "no-store" in _cache_directives(request_headers.get("Cache-Control")):
+        return False
+    if "no-store" in _cache_directives(response.headers.get("Cache-Control")):
+        return False
+    if response.headers.get("Vary", "").strip() == "*":
+        return False
+    return any(key in response.headers for key in
+               ("Cache-Control", "Expires", "ETag", "Last-Modified"))
+
+def _vary_values(vary, request_headers):
+    """The request header values named by Vary, as a JSON string."""
+    names = sorted(name.strip().lower() for name in vary.split(",") if name.strip())
+    return json.dumps([[name, request_headers.get(name)] for name in names])
+
+def _cached_response(url, status, headers, body):
+    """Rebuild a requests.Response from a stored entry."""
+    response = requests.models.Response()
+    response.status_code = status
+    response.reason = "OK"
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body
+    response.url = url
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+def cache_lookup(url, request_headers):
+    """Stored (status, headers, body, fresh) for url, or None."""
+    try:
+        with _CACHE_LOCK:
+            row = _http_cache().execute(
+                "SELECT status, headers, body, vary, fresh_until FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+    except sqlite3.Error as e:
+        print(f"[WARN] HTTP cache read failed for {url}: {e}")
+        return None
+    if row is None:
+        return None
+    status, headers, body, vary, fresh_until = row
+    headers = json.loads(headers)
+    if vary != _vary_values(headers.get("Vary", ""), request_headers):
+        return None
+    return status, headers, body, time.time() < fresh_until
+
+def cache_store(url, request_headers, response):
+    """Store a response (decoded body, so encoding headers are dropped)."""
+    now = time.time()
+    headers = {key: value for key, value in response.headers.items()
+               if key.lower() not in ("content-encoding", "content-length", "transfer-encoding")}
+    vary = _vary_values(headers.get("Vary", ""), request_headers)
+    try:
+        with _CACHE_LOCK:
+            conn = _http_cache()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (url, response.status_code, json.dumps(headers), response.content, vary,
+                 now + freshness_lifetime(response.headers, now)),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"[WARN] HTTP cache write failed for {url}: {e}")
+
+# -------------------------------------------------
+# Requests
+# -------------------------------------------------
+
+def _timeout(timeout):
+    return timeout if timeout is not None else (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+
+def get(url, headers=None, params=None, timeout=None, cache=True):
+    """
+    GET through the shared pooled session. Raises requests exceptions like
+    requests.get. When HTTP_CACHE_FILE is set (and cache is true), fresh
+    stored responses are returned without a request and stale ones are
+    revalidated. Requests that carry their own If-None-Match /
+    If-Modified-Since bypass the cache, so the caller sees the 304.
+    """
+    session = get_session()
+    request_headers = CaseInsensitiveDict(session.headers)
+    request_headers.update(headers or {})
+    full_url = requests.Request("GET", url, params=params).prepare().url
+
+    use_cache = (cache and HTTP_CACHE_FILE is not None
+                 and "If-None-Match" not in request_headers
+                 and "If-Modified-Since" not in request_headers)
+    stored = cache_lookup(full_url, request_headers) if use_cache else None
+    if stored is not None:
+        status, stored_headers, body, fresh = stored
+        if fresh:
+            with _STATS_LOCK:
+                _STATS["cache_hits"] += 1
+            metrics.inc("cache_requests_total", cache="http", result="hit")
+            return _cached_response(full_url, status, stored_headers, body)
+        headers = dict(headers or {})
+        if stored_headers.get("ETag"):
+            headers["If-None-Match"] = stored_headers["ETag"]
+        if stored_headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = stored_headers["Last-Modified"]
+
+    response = session.get(full_url, headers=headers, timeout=_timeout(timeout))
+    _record_transfer(response)
+
+    if stored is not None and response.status_code == 304:
+        merged = CaseInsensitiveDict(stored_headers)
+        merged.update(response.headers)
+        revalidated = _cached_response(full_url, status, dict(merged), body)
+        cache_store(full_url, request_headers, revalidated)
+        with _STATS_LOCK:
+            _STATS["cache_revalidated"] += 1
+        metrics.inc("cache_requests_total", cache="http", result="revalidated")
+        return revalidated
+
+    if use_cache:
+        metrics.inc("cache_requests_total", cache="http", result="miss")
+        if is_cacheable(request_headers, response):
+            cache_store(full_url, request_headers, response)
+    return response
+
+def post(url, json=None, headers=None, timeout=None):
+    """POST through the shared pooled session (never cached)."""
+    response = get_session().post(url, json=json, headers=headers, timeout=_timeout(timeout))
+    _record_transfer(response)
+    return response
@@ -0,0 +1,429 @@
+import os
+import sys
+import mmap
+import struct
+import threading
+import hashlib
+from bisect import bisect_left
+from array import array
+from collections import deque
+from collections.abc import Sequence
+
+# -------------------------------------------------
+# CelebCoinSentry Matcher Metadata
+# -------------------------------------------------
+SCRIPT_NAME = "CelebCoinSentry_Matcher"
+AUTHOR_NAME = "rnvntr"
+VERSION = "1.0.0"
+
+# -------------------------------------------------
+# Aho-Corasick Matcher
+# -------------------------------------------------
+#
+# The matcher is a plain dict of flat integer arrays so that the same lookup
+# code works on freshly built arrays and on buffers read back from disk:
+#
+#   edge_start[s] .. edge_start[s+1]  -> slice of edges leaving state s
+#   edge_chars / edge_targets         -> sorted char codes and target states
+#   fail[s]                           -> failure link of state s
+#   state_name[s]                     -> name index ending at s, or -1
+#   dict_link[s]                      -> nearest failure-ancestor with a name, or -1
+#   name_offsets / name_blob          -> UTF-8 names, addressed by name index
+
+def normalize_celebrity_names(names):
+    """
+    Lowercase, strip and deduplicate names.
+    Returns a sorted list so the built automaton is deterministic.
+    """
+    normalized = set()
+    for name in names:
+        clean = name.strip().lower()
+        if clean:
+            normalized.add(clean)
+    return sorted(normalized)
+
+def build_matcher(names):
+    """
+    Build an Aho-Corasick automaton over the normalized celebrity names.
+    Returns a matcher dict usable with find_matches().
+    """
+    normalized = normalize_celebrity_names(names)
+
+    # 1) Trie with dict children
+    children = [{}]
+    state_name = [-1]
+    for idx, name in enumerate(normalized):
+        state = 0
+        for ch in name:
+            nxt = children[state].get(ch)
+            if nxt is None:
+                nxt = len(children)
+                children[state][ch] = nxt
+                children.append({})
+                state_name.append(-1)
+            state = nxt
+        state_name[state] = idx
+
+    # 2) Failure and dictionary-suffix links (BFS order)
+    n_states = len(children)
+    fail = [0] * n_states
+    dict_link = [-1] * n_states
+    queue = deque(children[0].values())
+    while queue:
+        state = queue.popleft()
+        for ch, nxt in children[state].items():
+            f = fail[state]
+            while f and ch not in children[f]:
+                f = fail[f]
+            fail[nxt] = f = children[f].get(ch, 0)
+            dict_link[nxt] = f if state_name[f] != -1 else dict_link[f]
+            queue.append(nxt)
+
+    # 3) Flatten edges into sorted arrays
+    edge_start = array("i", [0])
+    edge_chars = array("i")
+    edge_targets = array("i")
+    for state in range(n_states):
+        for ch in sorted(children[state]):
+            edge_chars.append(ord(ch))
+            edge_targets.append(children[state][ch])
+        edge_start.append(len(edge_chars))
+
+    name_offsets = array("i", [0])
+    blob = bytearray()
+    for name in normalized:
+        blob += name.encode("utf-8")
+        name_offsets.append(len(blob))
+
+    return {
+        "edge_start": edge_start,
+        "edge_chars": edge_chars,
+        "edge_targets": edge_targets,
+        "fail": array("i", fail),
+        "state_name": array("i", state_name),
+        "dict_link": array("i", dict_link),
+        "name_offsets": name_offsets,
+        "name_blob": bytes(blob),
+    }
+
+def matcher_size(matcher):
+    """Number of distinct names in the matcher."""
+    return len(matcher["name_offsets"]) - 1
+
+def matcher_name(matcher, idx):
+    """Decode the name stored at index idx."""
+    offsets = matcher["name_offsets"]
+    return bytes(matcher["name_blob"][offsets[idx]:offsets[idx + 1]]).decode("utf-8")
+
+def iter_matcher_names(matcher):
+    """Yield every normalized name in the matcher, in sorted order."""
+    for idx in range(matcher_size(matcher)):
+        yield matcher_name(matcher, idx)
+
+def find_matches(matcher, text):
+    """
+    Scan text once and return every celebrity occurrence.
+    Returns a list of (start, end, name) tuples; offsets index the lowercased text.
+    """
+    edge_start = matcher["edge_start"]
+    edge_chars = matcher["edge_chars"]
+    edge_targets = matcher["edge_targets"]
+    fail = matcher["fail"]
+    state_name = matcher["state_name"]
+    dict_link = matcher["dict_link"]
+
+    # Most characters are read at the root, so its edges get a dict
+    # (built once per matcher) instead of a binary search.
+    root = matcher.get("root_edges")
+    if root is None:
+        root = matcher["root_edges"] = {
+            edge_chars[i]: edge_targets[i] for i in range(edge_start[0], edge_start[1])
+        }
+
+    hits = []
+    names = {}
+    state = 0
+    for pos, ch in enumerate(text.lower()):
+        code = ord(ch)
+        if state == 0:
+            state = root.get(code, 0)
+            if state == 0:
+                continue
+        else:
+            while True:
+                lo = edge_start[state]
+                hi = edge_start[state + 1]
+                i = bisect_left(edge_chars, code, lo, hi)
+                if i < hi and edge_chars[i] == code:
+                    state = edge_targets[i]
+                    break
+                if state == 0:
+                    break
+                state = fail[state]
+
+        out = state if state_name[state] != -1 else dict_link[state]
+        while out != -1:
+            idx = state_name[out]
+            name = names.get(idx)
+            if name is None:
+                name = names[idx] = matcher_name(matcher, idx)
+            hits.append((pos + 1 - len(name), pos + 1, name))
+            out = dict_link[out]
+    return hits
+
+def matched_names(hits):
+    """Distinct names from a list of hits, in first-seen order."""
+    seen = []
+    for _, _, name in hits:
+        if name not in seen:
+            seen.append(name)
+    return seen
+
+class MatcherNames(Sequence):
+    """
+    Read-only, sorted view of the names inside a matcher.
+    Names are decoded on access, so an mmap-backed matcher never
+    materializes the whole corpus as Python strings.
+    """
+
+    def __init__(self, matcher):
+        self.matcher = matcher
+
+    def __len__(self):
+        return matcher_size(self.matcher)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        return matcher_name(self.matcher, idx)
+
+    def __contains__(self, name):
+        if not isinstance(name, str):
+            return False
+        name = name.strip().lower()
+        i = bisect_left(self, name)
+        return i < len(self) and self[i] == name
+
+# -------------------------------------------------
+# Fuzzy Matching (trigram index)
+# -------------------------------------------------
+#
+# Catches mangled references the exact automaton misses ("ELONMUSK",
+# "Tay Swift Inu"). Names and text are compacted to lowercase letters and
+# digits; an inverted index from character trigrams to name indexes picks a
+# few candidates, and only those are scored by approximate-substring edit
+# distance, so per-coin cost follows the candidate count, not the corpus.
+
+FUZZY_MIN_NAME_LENGTH = 6  # compacted names shorter than this are exact-only
+
+def compact_text(text):
+    """
+    Lowercase text with everything but letters and digits removed.
+    Returns (compact, positions) where positions[i] is the index in text of
+    compact[i].
+    """
+    chars = []
+    positions = []
+    for pos, ch in enumerate(text.lower()):
+        if ch.isalnum():
+            chars.append(ch)
+            positions.append(pos)
+    return "".join(chars), positions
+
+def _trigrams(compact):
+    return {compact[i:i + 3] for i in range(len(compact) - 2)}
+
+def build_trigram_index(names, min_length=FUZZY_MIN_NAME_LENGTH):
+    """
+    Build the fuzzy index over normalized names (e.g. a MatcherNames view).
+    Returns an index dict usable with find_fuzzy_matches().
+    """
+    postings = {}
+    gram_counts = array("i")
+    for idx, name in enumerate(names):
+        compact, _ = compact_text(name)
+        grams = _trigrams(compact) if len(compact) >= min_length else set()
+        gram_counts.append(len(grams))
+        for gram in grams:
+            bucket = postings.get(gram)
+            if bucket is None:
+                bucket = postings[gram] = array("i")
+            bucket.append(idx)
+    return {"names": names, "postings": postings, "gram_counts": gram_counts}
+
+def substring_distance(pattern, text, limit):
+    """
+    Smallest edit distance between pattern and any substring of text
+    (Sellers' algorithm). Returns (distance, start, end), or None once the
+    distance is sure to exceed limit.
+    """
+    n = len(text)
+    prev = [0] * (n + 1)
+    prev_start = list(range(n + 1))
+    for i, pc in enumerate(pattern, 1):
+        cur = [i] + [0] * n
+        cur_start = [0] * (n + 1)
+        for j in range(1, n + 1):
+            best = prev[j - 1] + (pc != text[j - 1])
+            start = prev_start[j - 1]
+            if prev[j] + 1 < best:
+                best, start = prev[j] + 1, prev_start[j]
+            if cur[j - 1] + 1 < best:
+                best, start = cur[j - 1] + 1, cur_start[j - 1]
+            cur[j] = best
+            cur_start[j] = start
+        if min(cur) > limit:
+            return None
+        prev, prev_start = cur, cur_start
+    distance = min(prev)
+    end = prev.index(distance)
+    return distance, prev_start[end], end
+
+def find_fuzzy_matches(index, text, threshold=0.8, max_candidates=50):
+    """
+    Names that approximately occur in text with similarity >= threshold,
+    where similarity = 1 - edit distance / name length (compacted).
+    Returns a list of (start, end, name, score) tuples, best first; offsets
+    index the lowercased text.
+    """
+    compact, positions = compact_text(text)
+    if len(compact) < 3:
+        return []
+
+    postings = index["postings"]
+    shared = {}
+    for gram in _trigrams(compact):
+        for idx in postings.get(gram, ()):
+            shared[idx] = shared.get(idx, 0) + 1
+
+    # q-gram filter: k edits destroy at most 3k of a name's trigrams.
+    gram_counts = index["gram_counts"]
+    candidates = []
+    for idx, count in shared.items():
+        length = gram_counts[idx] + 2
+        max_edits = int((1.0 - threshold) * length)
+        if count >= max(1, gram_counts[idx] - 3 * max_edits):
+            candidates.append((count / gram_counts[idx], idx))
+    candidates.sort(reverse=True)
+
+    names = index["names"]
+    hits = []
+    for _, idx in candidates[:max_candidates]:
+        name = names[idx]
+        pattern, _ = compact_text(name)
+        max_edits = int((1.0 - threshold) * len(pattern))
+        found = substring_distance(pattern, compact, max_edits)
+        if found is None or found[0] > max_edits:
+            continue
+        distance, start, end = found
+        score = 1.0 - distance / len(pattern)
+        hits.append((positions[start], positions[end - 1] + 1, name, round(score, 3)))
+    hits.sort(key=lambda hit: -hit[3])
+    return hits
+
+# -------------------------------------------------
+# Precompiled Matcher Cache (mmap)
+# -------------------------------------------------
+#
+# Layout: header, then each int32 array in MATCHER_ARRAYS order, then the
+# UTF-8 name blob. The header carries the SHA-256 of the source names file,
+# so a stale cache is simply ignored and rebuilt.
+
+MATCHER_CACHE_MAGIC = b"CCSM"
+MATCHER_CACHE_VERSION = 1
+MATCHER_ARRAYS = (
+    "edge_start", "edge_chars", "edge_targets", "fail",
+    "state_name", "dict_link", "name_offsets",
+)
+_HEADER = struct.Struct(f"<4sIc32s{len(MATCHER_ARRAYS) + 1}I")
+_BYTEORDER_FLAG = b"L" if sys.byteorder == "little" else b"B"
+
+def save_matcher_cache(matcher, cache_path, source_digest):
+    """
+    Write the matcher to cache_path (temp file + rename, so readers
+    never see a partial file).
+    """
+    lengths = [len(matcher[key]) for key in MATCHER_ARRAYS]
+    lengths.append(len(matcher["name_blob"]))
+    header = _HEADER.pack(
+        MATCHER_CACHE_MAGIC, MATCHER_CACHE_VERSION, _BYTEORDER_FLAG,
+        source_digest, *lengths
+    )
+    # Per-process and per-thread temp name: the scraper and a reloading
+    # sentry may both write the cache at once, as separate processes or
+    # (in the daemon) on different threads of one process.
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for key in MATCHER_ARRAYS:
+            f.write(array("i", matcher[key]).tobytes())
+        f.write(bytes(matcher["name_blob"]))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, cache_path)
+
+def load_matcher_cache(cache_path, source_digest):
+    """
+    Map a cached matcher into memory.
+    Returns the matcher dict (backed by the mmap), or None if the cache is
+    missing, corrupt, or built from a different names file.
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mm) < _HEADER.size:
+        mm.close()
+        return None
+    magic, version, byteorder, digest, *lengths = _HEADER.unpack_from(mm, 0)
+    if (magic != MATCHER_CACHE_MAGIC or version != MATCHER_CACHE_VERSION
+            or byteorder != _BYTEORDER_FLAG or digest != source_digest):
+        mm.close()
+        return None
+
+    itemsize = array("i").itemsize
+    expected = _HEADER.size + sum(lengths[:-1]) * itemsize + lengths[-1]
+    if len(mm) != expected:
+        mm.close()
+        return None
+
+    view = memoryview(mm)
+    matcher = {}
+    offset = _HEADER.size
+    for key, length in zip(MATCHER_ARRAYS, lengths):
+        end = offset + length * itemsize
+        matcher[key] = view[offset:end].cast("i")
+        offset = end
+    matcher["name_blob"] = view[offset:offset + lengths[-1]]
+    return matcher
+
+def load_or_build_matcher(names_path, cache_path):
+    """
+    Return (matcher, from_cache) for the names file.
+    Uses the mmap cache when it matches the file's hash; otherwise builds the
+    automaton, writes the cache, and maps the fresh copy. The file is read
+    once, so the hash always describes the names that were built even if
+    the file is replaced meanwhile.
+    """
+    with open(names_path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).digest()
+    matcher = load_matcher_cache(cache_path, digest)
+    if matcher is not None:
+        return matcher, True
+
+    built = build_matcher(data.decode("utf-8").splitlines())
+    try:
+        save_matcher_cache(built, cache_path, digest)
+    except OSError as e:
+        print(f"[WARN] Could not write matcher cache {cache_path}: {e}")
+        return built, False
+    return load_matcher_cache(cache_path, digest) or built, False
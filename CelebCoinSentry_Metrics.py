@@ -0,0 +1,228 @@
+import time
+import threading
+import contextlib
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# -------------------------------------------------
+# CelebCoinSentry Metrics Metadata
+# -------------------------------------------------
+SCRIPT_NAME = "CelebCoinSentry_Metrics"
+AUTHOR_NAME = "rnvntr"
+VERSION = "1.0.0"
+
+# -------------------------------------------------
+# Metric Definitions
+# -------------------------------------------------
+#
+# Counters, gauges and histograms live in module-level dicts keyed by
+# (name, sorted label pairs) and are rendered in Prometheus text format.
+
+PREFIX = "celebcoinsentry_"
+
+HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+METRIC_HELP = {
+    "stage_seconds": ("histogram", "Time spent per pipeline stage."),
+    "cycles_total": ("counter", "Completed coin polling cycles."),
+    "scrapes_total": ("counter", "Completed Wikipedia update checks."),
+    "coins_seen_total": ("counter", "Coins returned by the coin sources."),
+    "source_coins_total": ("counter", "Coins reported per source (before dedup)."),
+    "duplicate_coins_total": ("counter", "Coins dropped because another source reported them first."),
+    "suspects_total": ("counter", "Coins that passed the partial check."),
+    "alerts_total": ("counter", "Alert deliveries by channel and result."),
+    "http_responses_total": ("counter", "HTTP responses by host and status."),
+    "http_bytes_total": ("counter", "HTTP response bytes by host, on the wire and decoded."),
+    "http_connections_opened_total": ("counter", "New connections opened (others were reused)."),
+    "rate_limit_wait_seconds_total": ("counter", "Time spent waiting on rate limits."),
+    "cache_requests_total": ("counter", "Cache lookups by cache and result (hit/miss)."),
+    "celebrity_names": ("gauge", "Names currently loaded into the matcher."),
+    "scraped_names": ("gauge", "Names written by the last changed scrape."),
+    "alerted_coins": ("gauge", "Coins in the alerted-coins set."),
+    "pages_crawled_total": ("counter", "Wiki sub-pages fetched."),
+    "names_rejected_total": ("counter", "Scraped names dropped by normalization, by reason."),
+    "name_corpus_names": ("gauge", "Names before (raw) and after (kept) the last normalization."),
+    "partial_hit_rate": ("gauge", "Share of sample coins flagged by the partial check, raw vs. kept names."),
+    "alert_claims_total": ("counter", "Alert-once claims in the shared store (won/lost/error)."),
+    "names_reloads_total": ("counter", "Celebrity name sets hot-reloaded."),
+    "skipped_runs_total": ("counter", "Daemon runs skipped because the previous one was still going."),
+    "profiles_captured_total": ("counter", "On-demand profiles written, by target."),
+}
+
+_LOCK = threading.Lock()
+_COUNTERS = {}
+_GAUGES = {}
+_HISTOGRAMS = {}  # key -> [bucket counts..., +Inf count], sum
+
+# Per-thread {stage: seconds} of the cycle being tracked. Thread-local so a
+# sentry cycle and a Wiki scrape can run side by side in one process; worker
+# threads join their caller's cycle through bind_cycle().
+_CYCLE = threading.local()
+
+def _key(name, labels):
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+# -------------------------------------------------
+# Recording
+# -------------------------------------------------
+
+def inc(name, value=1, **labels):
+    """Add value to a counter."""
+    key = _key(name, labels)
+    with _LOCK:
+        _COUNTERS[key] = _COUNTERS.get(key, 0) + value
+
+def set_gauge(name, value, **labels):
+    """Set a gauge to value."""
+    with _LOCK:
+        _GAUGES[_key(name, labels)] = value
+
+def observe(name, seconds, **labels):
+    """
+    Record one histogram observation. Observations of stage_seconds also
+    add to the current cycle's per-stage totals (see begin_cycle()).
+    """
+    key = _key(name, labels)
+    with _LOCK:
+        entry = _HISTOGRAMS.get(key)
+        if entry is None:
+            entry = _HISTOGRAMS[key] = [[0] * (len(HISTOGRAM_BUCKETS) + 1), 0.0]
+        entry[0][bisect_left(HISTOGRAM_BUCKETS, seconds)] += 1
+        entry[1] += seconds
+        stages = getattr(_CYCLE, "stages", None)
+        if stages is not None and name == "stage_seconds":
+            stage = labels.get("stage", "")
+            stages[stage] = stages.get(stage, 0.0) + seconds
+
+@contextlib.contextmanager
+def timed(stage, **labels):
+    """Time the with-block into stage_seconds{stage=...}."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe("stage_seconds", time.perf_counter() - started, stage=stage, **labels)
+
+def record_http_response(url, status):
+    """Count one HTTP response by host and status code."""
+    host = url.split("://", 1)[-1].split("/", 1)[0]
+    inc("http_responses_total", host=host, status=status)
+
+# -------------------------------------------------
+# Per-cycle Summary
+# -------------------------------------------------
+
+def begin_cycle():
+    """Start collecting per-stage totals for a new cycle on this thread."""
+    _CYCLE.stages = {}
+
+def end_cycle():
+    """Stop collecting and return {stage: seconds} for the finished cycle."""
+    stages = getattr(_CYCLE, "stages", None) or {}
+    _CYCLE.stages = None
+    with _LOCK:
+        return {stage: round(seconds, 6) for stage, seconds in stages.items()}
+
+def bind_cycle(func):
+    """
+    Wrap func so that, on whichever thread it runs, its timings count
+    towards the cycle active on the calling thread right now.
+    """
+    stages = getattr(_CYCLE, "stages", None)
+
+    def run(*args, **kwargs):
+        previous = getattr(_CYCLE, "stages", None)
+        _CYCLE.stages = stages
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _CYCLE.stages = previous
+    return run
+
+def counter_value(name, **labels):
+    """Current value of a counter (0 if never incremented)."""
+    with _LOCK:
+        return _COUNTERS.get(_key(name, labels), 0)
+
+# -------------------------------------------------
+# Prometheus Exposition
+# -------------------------------------------------
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels_text(pairs, extra=()):
+    pairs = list(pairs) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+def _format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+def render_prometheus():
+    """All metrics in Prometheus text exposition format (version 0.0.4)."""
+    with _LOCK:
+        counters = dict(_COUNTERS)
+        gauges = dict(_GAUGES)
+        histograms = {k: ([*v[0]], v[1]) for k, v in _HISTOGRAMS.items()}
+
+    by_name = {}
+    for store in (counters, gauges, histograms):
+        for name, labels in store:
+            by_name.setdefault(name, []).append((labels, store))
+
+    lines = []
+    for name in sorted(by_name):
+        kind, help_text = METRIC_HELP.get(name, ("untyped", name))
+        full = PREFIX + name
+        lines.append(f"# HELP {full} {help_text}")
+        lines.append(f"# TYPE {full} {kind}")
+        for labels, store in sorted(by_name[name], key=lambda item: item[0]):
+            if store is histograms:
+                buckets, total = histograms[(name, labels)]
+                cumulative = 0
+                for bound, count in zip(HISTOGRAM_BUCKETS + ("+Inf",), buckets):
+                    cumulative += count
+                    le = bound if bound == "+Inf" else _format_value(float(bound))
+                    lines.append(f"{full}_bucket{_labels_text(labels, [('le', le)])} {cumulative}")
+                lines.append(f"{full}_sum{_labels_text(labels)} {_format_value(float(total))}")
+                lines.append(f"{full}_count{_labels_text(labels)} {cumulative}")
+            else:
+                lines.append(f"{full}{_labels_text(labels)} {_format_value(store[(name, labels)])}")
+    return "\n".join(lines) + "\n"
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def start_metrics_server(port, host="127.0.0.1"):
+    """
+    Serve /metrics on host:port from a daemon thread.
+    Returns the server, or None if port is falsy or can't be bound.
+    """
+    if not port:
+        return None
+    try:
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        print(f"[WARN] Could not start metrics endpoint on {host}:{port}: {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    print(f"[INFO] Metrics endpoint at http://{host}:{server.server_port}/metrics")
+    return server
@@ -0,0 +1,267 @@
+import io
+import os
+import sys
+import time
+import signal
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from datetime import datetime
+
+import CelebCoinSentry_Metrics as metrics
+
+# -------------------------------------------------
+# CelebCoinSentry Profiler Metadata
+# -------------------------------------------------
+SCRIPT_NAME = "CelebCoinSentry_Profiler"
+AUTHOR_NAME = "rnvntr"
+VERSION = "1.0.0"
+
+# -------------------------------------------------
+# Configuration
+# -------------------------------------------------
+#
+# On-demand profiling of a running process. Arm a target (the sentry's
+# "sentry" cycle or the Wiki Scraper's "scraper" run) with its signal, e.g.
+#   kill -USR1 <sentry pid>      kill -USR2 <scraper pid>
+# or by creating its trigger file (removed once picked up). The next run of
+# that target is then captured with cProfile (on the calling thread and the
+# worker threads it hands work to) and tracemalloc, and written to
+# PROFILE_DIR as <target>-<timestamp>-<pid>.prof (pstats dump: open with
+# `python -m pstats` or snakeviz) plus a .txt report.
+# One capture runs at a time per process: a target triggered while another
+# capture is running stays armed for its next run. From Python 3.12 cProfile
+# is process-wide (one profiler sees every thread, including unrelated
+# ones such as the daemon's other task); before that each thread gets its
+# own profiler and they're merged. If another profiling tool (a debugger,
+# coverage) is already active, the run goes ahead unprofiled.
+# While nothing is armed, each run only checks a set and stats one file.
+
+PROFILE_DIR = "CelebCoinSentry_profiles"
+PROFILE_TOP_FUNCTIONS = 40  # rows per pstats table in the report
+PROFILE_TOP_ALLOCATIONS = 25  # rows per tracemalloc table in the report
+PROFILE_TRACEMALLOC_FRAMES = 1  # frames kept per allocation traceback
+
+# -------------------------------------------------
+# Triggers
+# -------------------------------------------------
+
+_ARMED = set()  # targets whose next run is captured
+_ACTIVE = threading.local()  # .capture: the capture running on this thread
+_TRACE_LOCK = threading.Lock()
+_TRACE_USERS = 0  # captures currently relying on tracemalloc
+_CAPTURE_LOCK = threading.Lock()  # held while a capture runs
+_PROCESS_WIDE = sys.version_info >= (3, 12)  # cProfile on sys.monitoring
+
+def arm(target):
+    """Capture the next run of target (safe to call from a signal handler)."""
+    _ARMED.add(target)
+
+def install_signal_trigger(target, signal_name):
+    """
+    Arm target whenever signal_name (e.g. "SIGUSR1") is received.
+    Must run on the main thread; a no-op where the signal doesn't exist.
+    """
+    signum = getattr(signal, signal_name or "", None)
+    if signum is None:
+        return False
+    try:
+        signal.signal(signum, lambda *_: arm(target))
+    except ValueError as e:  # not the main thread
+        print(f"[WARN] Could not install {signal_name} profiling trigger: {e}")
+        return False
+    print(f"[INFO] Send {signal_name} to pid {os.getpid()} to profile the next {target} run.")
+    return True
+
+def take_trigger(target, trigger_file=None):
+    """
+    Whether the next run of target should be captured: it was armed by a
+    signal, or trigger_file exists (it is removed). Clears the trigger.
+    """
+    if target in _ARMED:
+        _ARMED.discard(target)
+        return "signal"
+    if trigger_file and os.path.exists(trigger_file):
+        try:
+            os.remove(trigger_file)
+        except OSError:
+            pass
+        return "file"
+    return None
+
+# -------------------------------------------------
+# Capture
+# -------------------------------------------------
+
+def _start_tracing():
+    global _TRACE_USERS
+    with _TRACE_LOCK:
+        if _TRACE_USERS == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+            _TRACE_USERS = 1
+        elif _TRACE_USERS:
+            _TRACE_USERS += 1
+
+def _stop_tracing():
+    """Stop tracemalloc if we started it and no other capture still uses it."""
+    global _TRACE_USERS
+    with _TRACE_LOCK:
+        if _TRACE_USERS:
+            _TRACE_USERS -= 1
+            if _TRACE_USERS == 0:
+                tracemalloc.stop()
+
+def bind(func):
+    """
+    Wrap func so that, while a capture is running on the calling thread,
+    the worker threads running func are profiled into it too.
+    Returns func unchanged when nothing is being captured, or when the
+    capture's profiler already sees every thread (Python 3.12+).
+    """
+    capture = getattr(_ACTIVE, "capture", None)
+    if capture is None or _PROCESS_WIDE:
+        return func
+
+    def run(*args, **kwargs):
+        if getattr(_ACTIVE, "capture", None) is not None:
+            return func(*args, **kwargs)  # this thread is already profiled
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # another profiler owns this thread; the capture goes on
+            return func(*args, **kwargs)
+        _ACTIVE.capture = capture
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            _ACTIVE.capture = None
+            with capture["lock"]:
+                capture["profiles"].append(profile)
+    return run
+
+def profiled_call(target, func, trigger_file=None, sizes=None):
+    """
+    Call func() and return its result. If target is armed (see
+    take_trigger()), the call is captured and a profile written; sizes is
+    an optional callable returning {name: size} recorded before and after.
+    """
+    trigger = take_trigger(target, trigger_file)
+    if trigger is None:
+        return func()
+    if not _CAPTURE_LOCK.acquire(blocking=False):
+        print(f"[INFO] Another capture is running; profiling the next {target} run instead.")
+        arm(target)
+        return func()
+    try:
+        return _capture(target, trigger, func, sizes)
+    finally:
+        _CAPTURE_LOCK.release()
+
+def _capture(target, trigger, func, sizes):
+    """profiled_call() for a triggered run. Caller holds _CAPTURE_LOCK."""
+    print(f"[INFO] Profiling this {target} run (triggered by {trigger}).")
+    capture = {"lock": threading.Lock(), "profiles": []}
+    sizes_before = sizes() if sizes else {}
+    _start_tracing()
+    snapshot_before = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+    started_at = datetime.now()
+    started = time.perf_counter()
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError as e:  # e.g. a debugger or coverage already profiling
+        _stop_tracing()
+        print(f"[WARN] Not profiling this {target} run: {e}")
+        return func()
+    _ACTIVE.capture = capture
+    result = None
+    try:
+        result = func()
+        return result
+    finally:
+        profile.disable()
+        _ACTIVE.capture = None
+        seconds = time.perf_counter() - started
+        snapshot_after = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        traced = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else None
+        _stop_tracing()
+        with capture["lock"]:
+            profiles = [profile] + capture["profiles"]
+        write_capture(target, trigger, started_at, seconds, profiles,
+                      snapshot_before, snapshot_after, traced,
+                      sizes_before, sizes() if sizes else {}, result)
+        metrics.inc("profiles_captured_total", target=target)
+
+# -------------------------------------------------
+# Reports
+# -------------------------------------------------
+
+def _stats_table(stats, sort_key):
+    out = io.StringIO()
+    stats.stream = out
+    stats.sort_stats(sort_key).print_stats(PROFILE_TOP_FUNCTIONS)
+    return out.getvalue()
+
+def _allocation_lines(snapshot_before, snapshot_after, traced):
+    lines = []
+    if snapshot_after is None:
+        return ["(tracemalloc unavailable)"]
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    snapshot_after = snapshot_after.filter_traces(filters)
+    lines.append(f"Top {PROFILE_TOP_ALLOCATIONS} allocations still live at the end of the run (by line):")
+    for stat in snapshot_after.statistics("lineno")[:PROFILE_TOP_ALLOCATIONS]:
+        lines.append(f"  {stat}")
+    if snapshot_before is not None:
+        snapshot_before = snapshot_before.filter_traces(filters)
+        lines.append("")
+        lines.append(f"Top {PROFILE_TOP_ALLOCATIONS} changes during the run (by line):")
+        for stat in snapshot_after.compare_to(snapshot_before, "lineno")[:PROFILE_TOP_ALLOCATIONS]:
+            lines.append(f"  {stat}")
+    if traced is not None:
+        lines.append("")
+        lines.append(f"Traced memory at the end: {traced[0]} bytes (peak {traced[1]} bytes)")
+    return lines
+
+def write_capture(target, trigger, started_at, seconds, profiles,
+                  snapshot_before, snapshot_after, traced, sizes_before, sizes_after, result):
+    """
+    Write <target>-<timestamp>-<pid>.prof (merged pstats of every profiled
+    thread) and a .txt report next to it. Returns the report path, or None.
+    """
+    stamp = started_at.strftime("%Y%m%d-%H%M%S")
+    base = os.path.join(PROFILE_DIR, f"{target}-{stamp}-{os.getpid()}")
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        stats = pstats.Stats(profiles[0])
+        for extra in profiles[1:]:
+            stats.add(extra)
+        stats.dump_stats(base + ".prof")
+
+        lines = [
+            f"{SCRIPT_NAME} v{VERSION} capture of one {target} run",
+            f"Started:   {started_at.isoformat(timespec='seconds')} (triggered by {trigger})",
+            f"Duration:  {seconds:.3f} s, {len(profiles)} profiled thread run(s)",
+            "",
+            "Sizes (before -> after):",
+        ]
+        for name in sorted(set(sizes_before) | set(sizes_after)):
+            lines.append(f"  {name}: {sizes_before.get(name)} -> {sizes_after.get(name)}")
+        if isinstance(result, dict):
+            lines.append("")
+            lines.append("Run summary:")
+            for key, value in result.items():
+                lines.append(f"  {key}: {value}")
+        lines.append("")
+        lines.append(_stats_table(stats, "cumulative"))
+        lines.append(_stats_table(stats, "tottime"))
+        lines.extend(_allocation_lines(snapshot_before, snapshot_after, traced))
+
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    except (OSError, TypeError) as e:
+        print(f"[WARN] Could not write profile {base}: {e}")
+        return None
+    print(f"[INFO] Profile written to {base}.prof and {base}.txt")
+    return base + ".txt"
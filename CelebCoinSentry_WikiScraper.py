@@ -1,8 +1,19 @@
 import time
 import json
 import os
+import re
+import hashlib
+import unicodedata
+import threading
 import requests
-from bs4 import BeautifulSoup
+from urllib.parse import unquote
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import CelebCoinSentry_Http as http
+import CelebCoinSentry_Metrics as metrics
+import CelebCoinSentry_Profiler as profiling
+from CelebCoinSentry_Extract import extract_list_item_links
+from CelebCoinSentry_Matcher import build_matcher, find_matches, save_matcher_cache
 
 # -----------------------------------------------------
 # CelebCoinSentry Wiki Scraper Metadata
@@ -22,59 +33,240 @@ MAIN_PAGE_TITLE = "Lists_of_celebrities"
 # 24 hours = 86400 seconds
 SCRAPE_INTERVAL = 86400
 
+# HTML extraction backend: "auto", "lxml", "strainer" or "bs4"
+# (see CelebCoinSentry_Extract.py; "bs4" is the original full parse)
+HTML_PARSER_BACKEND = "auto"
+
+# -----------------------------------------------------
+# Crawl Config
+# -----------------------------------------------------
+# Sub-pages are fetched by a bounded worker pool over the shared keep-alive
+# HTTP client (CelebCoinSentry_Http.py). CRAWL_MAX_REQUESTS_PER_SECOND is a politeness cap shared by
+# all workers; transient failures (connection errors, timeouts, 429, 5xx)
+# are retried with exponential backoff, other 4xx responses are not.
+CRAWL_WORKERS = 8
+CRAWL_MAX_REQUESTS_PER_SECOND = 5
+CRAWL_RETRIES = 3
+CRAWL_RETRY_BACKOFF = 2  # seconds, doubled per attempt
+CRAWL_PROGRESS_EVERY = 25  # pages between progress lines
+REVISION_BATCH_SIZE = 50  # titles per MediaWiki prop=revisions request
+CRAWL_USER_AGENT = f"{SCRIPT_NAME}/{VERSION} (https://github.com/rnvntr/CelebCoinSentry)"
+
+# -----------------------------------------------------
+# Name Normalization Config
+# -----------------------------------------------------
+# Every scraped name goes through a normalization stage before it is saved:
+#   1) link structure: only links to ordinary articles count; lists,
+#      categories, files, other namespaces, titles disambiguated as a
+#      non-person ("(film)", "(band)", ...) and titles naming an
+#      institution ("..._University") are dropped when a page is parsed
+#   2) Unicode folding (NFKC, plus an accent-free variant: "Beyoncé" also
+#      yields "Beyonce"), parentheticals and [notes] stripped
+#   3) shape: 2+ words, < 60 chars. Digits and lowercase words are allowed
+#      ("50 Cent", "k.d. lang", "Tyler, the Creator")
+#   4) ambiguity (opt-in): the share of a name's words that are ordinary
+#      words in NAME_REFERENCE_CORPUS_FILE; names at or above
+#      NAME_MAX_AMBIGUITY ("Golden State", "Green Day") are dropped.
+#      No corpus ships with the scraper, so this step is off by default.
+# Names that survive are what the sentry matches against, so every name
+# dropped here is a description lookup (and its rate-limit wait) saved.
+
+# Local reference corpus for ambiguity scores: any plain English text, or a
+# word-frequency list ("word count" per line). None (default) skips step 4.
+NAME_REFERENCE_CORPUS_FILE = None
+NAME_COMMON_WORD_MIN_COUNT = 50  # occurrences that make a word "ordinary"
+NAME_MAX_AMBIGUITY = 1.0  # drop names whose every word is ordinary
+NAME_AMBIGUITY_FILE = "CelebCoinSentry_name_ambiguity.json"  # {name: score}, kept names
+
+# Optional sample of coins (JSONL, one {"name", "symbol", ...} per line, as
+# used by CelebCoinSentry_BulkScan.py) for reporting the partial-match hit
+# rate before vs. after normalization. None (default) skips the report.
+NAME_HIT_SAMPLE_FILE = None
+NAME_HIT_SAMPLE_MAX = 5000  # records read from the sample
+
+NON_ARTICLE_NAMESPACES = {
+    "Category", "File", "Image", "Help", "Portal", "Special", "Template",
+    "Talk", "User", "Wikipedia", "WP", "Draft", "Module", "MediaWiki",
+}
+# Words that mark a linked article as something other than a person,
+# anywhere in its title ("Coachella_Festival"). Only words that are not
+# also surnames: a person's title is their name ("Kathleen_Battle").
+NON_PERSON_WORDS = {
+    "academy", "airport", "album", "association", "awards", "championship",
+    "corporation", "county", "district", "entertainment", "episode",
+    "festival", "franchise", "genus", "hospital", "institute", "magazine",
+    "museum", "newspaper", "olympics", "orchestra", "productions", "province",
+    "railway", "records", "society", "species", "stadium", "studios",
+    "television", "theatre", "theater", "university",
+}
+# Further words that only count as the last word of a title's
+# disambiguator, where they say what the article is ("Thriller_(song)").
+NON_PERSON_DISAMBIGUATORS = NON_PERSON_WORDS | {
+    "band", "channel", "character", "company", "disambiguation", "duo",
+    "film", "game", "group", "league", "musical", "network", "novel",
+    "opera", "radio", "season", "series", "ship", "show", "song", "team",
+    "tour", "video",
+}
+
 # -----------------------------------------------------
 # Local Filenames
 # -----------------------------------------------------
 LAST_REVISION_FILE = "CelebCoinSentry_last_revision.json"
+SUBPAGE_NAMES_FILE = "CelebCoinSentry_subpage_names.json"
 CELEBRITY_NAMES_FILE = "CelebCoinSentry_celebrity_names.txt"
+CELEBRITY_MATCHER_CACHE_FILE = "CelebCoinSentry_celebrity_matcher.bin"
+
+# Prometheus-format metrics endpoint (None disables); the sentry uses 9100.
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9101
+
+# On-demand profiling of the next scrape: send PROFILE_SIGNAL or create
+# PROFILE_TRIGGER_FILE (see CelebCoinSentry_Profiler.py). The sentry uses
+# SIGUSR1, so both can be triggered separately when run in one daemon.
+PROFILE_SIGNAL = "SIGUSR2"
+PROFILE_TRIGGER_FILE = "CelebCoinSentry_WikiScraper_profile.trigger"
 
 # -----------------------------------------------------
-# Wikipedia Functions
+# HTTP Helpers (shared client + politeness)
 # -----------------------------------------------------
 
-def get_page_last_revision_timestamp(page_title):
+_POLITENESS_LOCK = threading.Lock()
+_NEXT_REQUEST_AT = 0.0
+
+def build_headers():
+    """Headers for every Wikipedia request (identifying User-Agent)."""
+    return {"User-Agent": CRAWL_USER_AGENT}
+
+def wait_for_politeness_slot():
+    """Space requests across all workers to CRAWL_MAX_REQUESTS_PER_SECOND."""
+    global _NEXT_REQUEST_AT
+    with _POLITENESS_LOCK:
+        now = time.monotonic()
+        slot = max(now, _NEXT_REQUEST_AT)
+        _NEXT_REQUEST_AT = slot + 1.0 / CRAWL_MAX_REQUESTS_PER_SECOND
+    if slot > now:
+        time.sleep(slot - now)
+        metrics.inc("rate_limit_wait_seconds_total", slot - now, api="wikipedia")
+
+def is_retryable(error):
     """
-    Fetches the last revision timestamp for the given Wikipedia page.
-    Returns a string like '2025-01-27T19:03:08Z' or None if not found.
+    Connection errors, timeouts, 429 and 5xx are worth retrying; any other
+    HTTP error (a dead or 404 link) will fail the same way again.
     """
-    params = {
-        "action": "query",
-        "prop": "revisions",
-        "rvprop": "timestamp",
-        "titles": page_title,
-        "format": "json"
-    }
-    try:
-        response = requests.get(WIKIPEDIA_API_URL, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-        pages = data.get("query", {}).get("pages", {})
-        # There's typically only one page in the result
-        for _, page_data in pages.items():
-            revisions = page_data.get("revisions")
-            if revisions and len(revisions) > 0:
-                return revisions[0].get("timestamp")
-    except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Failed to retrieve revision timestamp: {e}")
+    if isinstance(error, requests.exceptions.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status == 429 or (status is not None and status >= 500)
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+def fetch_page(url):
+    """
+    GET url through the shared HTTP client, retrying transient failures
+    (see is_retryable()) with backoff.
+    Returns the response text, or None on a permanent error or once
+    retries are exhausted.
+    """
+    for attempt in range(CRAWL_RETRIES + 1):
+        wait_for_politeness_slot()
+        try:
+            with metrics.timed("fetch", source="wikipedia"):
+                response = http.get(url, headers=build_headers())
+            response.raise_for_status()
+            return response.text
+        except requests.exceptions.RequestException as e:
+            if attempt == CRAWL_RETRIES or not is_retryable(e):
+                print(f"[WARN] Could not retrieve {url}: {e}")
+                return None
+            time.sleep(CRAWL_RETRY_BACKOFF * (2 ** attempt))
     return None
 
-def load_last_revision():
+# -----------------------------------------------------
+# Wikipedia Functions
+# -----------------------------------------------------
+
+def path_to_title(path):
+    """Turn '/wiki/List_of_X#Section' into the page title 'List_of_X'."""
+    return unquote(path.split("#", 1)[0][len("/wiki/"):])
+
+def get_revision_ids(titles):
+    """
+    Fetch the latest revision ID of each title, REVISION_BATCH_SIZE titles
+    per MediaWiki API request.
+    Returns {title: revid} for the titles that exist; titles from a batch
+    that failed are simply missing from the result.
+    """
+    revids = {}
+    titles = list(titles)
+    for start in range(0, len(titles), REVISION_BATCH_SIZE):
+        batch = titles[start:start + REVISION_BATCH_SIZE]
+        params = {
+            "action": "query",
+            "prop": "revisions",
+            "rvprop": "ids",
+            "titles": "|".join(batch),
+            "format": "json",
+            "formatversion": "2"
+        }
+        wait_for_politeness_slot()
+        try:
+            with metrics.timed("revision_query"):
+                response = http.get(WIKIPEDIA_API_URL, headers=build_headers(),
+                                    params=params, cache=False)
+            response.raise_for_status()
+            query = response.json().get("query", {})
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"[ERROR] Failed to retrieve revision IDs: {e}")
+            continue
+
+        # The API answers with normalized titles ('List of X'); map them back.
+        original = {title: title for title in batch}
+        for entry in query.get("normalized", []):
+            original[entry.get("to")] = entry.get("from")
+        for page in query.get("pages", []):
+            revisions = page.get("revisions")
+            if revisions and page.get("title") in original:
+                revids[original[page["title"]]] = revisions[0].get("revid")
+    return revids
+
+def load_revision_state():
     """
-    Load the last known revision timestamp from a local JSON file.
-    If the file doesn't exist, return None.
+    Load the last known revision IDs from a local JSON file:
+    {"main_revid": 123, "subpages": {"/wiki/List_of_...": 456, ...}}.
+    "subpages" lists every sub-page linked from the main page; a page that
+    hasn't been parsed successfully yet has None, so it is retried.
+    If the file doesn't exist (or predates revision IDs), everything is
+    scraped once.
     """
+    state = {"main_revid": None, "subpages": {}}
     if os.path.exists(LAST_REVISION_FILE):
         with open(LAST_REVISION_FILE, "r", encoding="utf-8") as f:
             data = json.load(f)
-            return data.get("last_timestamp")
-    return None
+        state["main_revid"] = data.get("main_revid")
+        state["subpages"] = data.get("subpages", {})
+    return state
 
-def save_last_revision(timestamp):
+def save_revision_state(state):
     """
-    Save the last known revision timestamp to a local JSON file.
+    Save the revision IDs to a local JSON file.
     """
     with open(LAST_REVISION_FILE, "w", encoding="utf-8") as f:
-        json.dump({"last_timestamp": timestamp}, f)
+        json.dump(state, f)
+
+def load_subpage_names():
+    """
+    Load the names each sub-page contributed on earlier runs
+    ({path: [names]}), so unchanged pages needn't be re-parsed.
+    """
+    if os.path.exists(SUBPAGE_NAMES_FILE):
+        with open(SUBPAGE_NAMES_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+def save_subpage_names(subpage_names):
+    """
+    Save the per-sub-page names to a local JSON file.
+    """
+    with open(SUBPAGE_NAMES_FILE, "w", encoding="utf-8") as f:
+        json.dump(subpage_names, f)
 
 def get_subpage_links():
     """
@@ -82,23 +274,14 @@ def get_subpage_links():
     Returns a list of relative URLs like '/wiki/List_of_American_film_actresses', etc.
     """
     url = f"{BASE_WIKIPEDIA_URL}/wiki/{MAIN_PAGE_TITLE}"
-    try:
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Could not retrieve {url}: {e}")
-        return []
-    
-    soup = BeautifulSoup(response.text, "html.parser")
-    content_div = soup.find("div", {"class": "mw-parser-output"})
-    if not content_div:
+    html = fetch_page(url)
+    if html is None:
         return []
     
     sub_links = []
-    for li in content_div.find_all("li"):
-        a_tag = li.find("a", href=True)
-        if a_tag and a_tag['href'].startswith("/wiki/"):
-            sub_links.append(a_tag['href'])
+    for href, _ in extract_list_item_links(html, HTML_PARSER_BACKEND):
+        if href.startswith("/wiki/"):
+            sub_links.append(href)
     
     return list(set(sub_links))  # deduplicate
 
@@ -109,98 +292,455 @@ def parse_list_page(path):
     Returns a list of name strings.
     """
     url = BASE_WIKIPEDIA_URL + path
-    try:
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        print(f"[WARN] Could not retrieve {url}: {e}")
+    html = fetch_page(url)
+    if html is None:
         return []
-    
-    soup = BeautifulSoup(response.text, "html.parser")
-    content_div = soup.find("div", {"class": "mw-parser-output"})
-    if not content_div:
-        return []
-    
+    return extract_names_from_html(html)
+
+def extract_names_from_html(html):
+    """
+    Pull potential celebrity names out of a sub-list page's HTML.
+    Returns a list of name strings.
+    """
     names = []
+    with metrics.timed("parse", source="wikipedia"):
+        links = extract_list_item_links(html, HTML_PARSER_BACKEND)
     # Naive approach: collect text from <li> elements with <a> inside
-    for li in content_div.find_all("li"):
-        a_tag = li.find("a", href=True)
-        if a_tag:
-            possible_name = a_tag.get_text().strip()
-            # Basic filters to avoid nonsense or references
-            if len(possible_name.split()) >= 2 and len(possible_name) < 60:
+    rejected = 0
+    for href, possible_name in links:
+        # Basic filters to avoid nonsense or references
+        if len(possible_name.split()) >= 2 and len(possible_name) < 60:
+            if is_person_link(href, possible_name):
                 names.append(possible_name)
+            else:
+                rejected += 1
+    if rejected:
+        metrics.inc("names_rejected_total", rejected, reason="link")
     
     return names
 
+# -----------------------------------------------------
+# Name Corpus Normalization
+# -----------------------------------------------------
+
+_PARENTHETICAL = re.compile(r"\s*[\(\[][^\)\]]*[\)\]]")
+_WORD = re.compile(r"[a-z]+")
+
+_REFERENCE_CORPUS = {"path": None, "mtime": None, "counts": {}}
+
+def title_disambiguator(title):
+    """'Prince_(musician)' -> 'musician'; '' when the title has none."""
+    match = re.search(r"\(([^)]*)\)\s*$", title.replace("_", " "))
+    return match.group(1) if match else ""
+
+def is_person_link(href, text):
+    """
+    Use the link's target to tell person articles from everything else in a
+    list: the link must go to an ordinary article (not a list, a category, a
+    file or another namespace), the title must not be disambiguated as a
+    non-person ("Thriller (album)") or name an institution ("Juilliard
+    School"), and the link text must share a word with the title (so
+    "born 1958"-style links to year pages are dropped).
+    """
+    if not href.startswith("/wiki/"):
+        return False
+    title = path_to_title(href)
+    if ":" in title and title.split(":", 1)[0] in NON_ARTICLE_NAMESPACES:
+        return False
+    if title.startswith(("List_of", "Lists_of")):
+        return False
+    # A disambiguator's last word says what the article is: "(2004 film)",
+    # but "(university president)".
+    disambiguator = _WORD.findall(title_disambiguator(title).lower())
+    if disambiguator and disambiguator[-1] in NON_PERSON_DISAMBIGUATORS:
+        return False
+    title_words = set(_WORD.findall(fold_text(title).lower()))
+    if set(_WORD.findall(fold_text(_PARENTHETICAL.sub("", title)).lower())) & NON_PERSON_WORDS:
+        return False  # judged without the disambiguator: "(university president)" is a person
+    return bool(title_words & set(_WORD.findall(fold_text(text).lower())))
+
+def fold_text(text):
+    """Drop accents and other combining marks: 'Beyoncé' -> 'Beyonce'."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+def normalize_name(name):
+    """
+    NFKC-normalize a scraped name, strip parentheticals and [notes], and
+    collapse whitespace: 'Prince  (musician)' -> 'Prince'.
+    """
+    name = unicodedata.normalize("NFKC", name)
+    name = _PARENTHETICAL.sub("", name)
+    return " ".join(name.split()).strip(" ,;:-\u2013\u2014")
+
+def name_rejection(name):
+    """
+    Why a normalized name can't be used ('shape': a single word or too
+    long to be a name), or None. Case and digits are left alone: "50 Cent"
+    and "k.d. lang" are names too.
+    """
+    if len(name.split()) < 2 or len(name) >= 60:
+        return "shape"
+    return None
+
+def load_reference_corpus():
+    """
+    Word counts of NAME_REFERENCE_CORPUS_FILE (reloaded when it changes).
+    Lines of the form "word count" are read as a frequency list, anything
+    else as running text. Returns {} if no corpus is configured.
+    """
+    path = NAME_REFERENCE_CORPUS_FILE
+    if not path:
+        return {}
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError as e:
+        print(f"[WARN] Reference corpus {path} unavailable: {e}")
+        return {}
+    if _REFERENCE_CORPUS["path"] == path and _REFERENCE_CORPUS["mtime"] == mtime:
+        return _REFERENCE_CORPUS["counts"]
+
+    counts = {}
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 2 and parts[1].isdigit():
+                word = fold_text(parts[0]).lower()
+                counts[word] = counts.get(word, 0) + int(parts[1])
+                continue
+            for word in _WORD.findall(fold_text(line).lower()):
+                counts[word] = counts.get(word, 0) + 1
+    _REFERENCE_CORPUS.update(path=path, mtime=mtime, counts=counts)
+    print(f"[INFO] Loaded reference corpus {path} ({len(counts)} distinct words).")
+    return counts
+
+def ambiguity_score(name, word_counts):
+    """
+    Share of the name's words that are ordinary words in the reference
+    corpus (seen >= NAME_COMMON_WORD_MIN_COUNT times): 0.0 for 'Elon Musk',
+    1.0 for 'Golden State'.
+    """
+    words = _WORD.findall(fold_text(name).lower())
+    if not words:
+        return 0.0
+    common = sum(1 for word in words if word_counts.get(word, 0) >= NAME_COMMON_WORD_MIN_COUNT)
+    return round(common / len(words), 3)
+
+def load_hit_sample():
+    """'name symbol' texts from NAME_HIT_SAMPLE_FILE (None if not configured)."""
+    if not NAME_HIT_SAMPLE_FILE:
+        return None
+    texts = []
+    try:
+        with open(NAME_HIT_SAMPLE_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    texts.append(f"{record.get('name') or ''} {record.get('symbol') or ''}")
+                if len(texts) >= NAME_HIT_SAMPLE_MAX:
+                    break
+    except OSError as e:
+        print(f"[WARN] Hit-rate sample {NAME_HIT_SAMPLE_FILE} unavailable: {e}")
+        return None
+    return texts
+
+def partial_hit_rate(names, texts):
+    """Share of sample texts the partial (name/symbol) check would flag."""
+    if not texts:
+        return 0.0
+    matcher = build_matcher(names)
+    return round(sum(1 for text in texts if find_matches(matcher, text)) / len(texts), 4)
+
+def normalize_name_corpus(names, link_rejected=0):
+    """
+    The normalization stage run before the names file is saved (see
+    "Name Normalization Config"). Link-structure rejections already
+    happened while pages were parsed; pass their count as link_rejected
+    so the report covers the whole pipeline.
+    Returns (kept names, report dict); the report is also logged and
+    exported as metrics.
+    """
+    with metrics.timed("normalize"):
+        word_counts = load_reference_corpus()
+        rejected = {"shape": 0, "ambiguous": 0, "duplicate": 0}
+        stripped = 0
+        folded = 0
+        kept = {}  # casefolded -> name
+        scores = {}
+        for raw in sorted(names):
+            name = normalize_name(raw)
+            if name != raw.strip():
+                stripped += 1
+            reason = name_rejection(name)
+            if reason is None and word_counts:
+                score = ambiguity_score(name, word_counts)
+                if score >= NAME_MAX_AMBIGUITY:
+                    reason = "ambiguous"
+                else:
+                    scores[name] = score
+            if reason is not None:
+                rejected[reason] += 1
+                continue
+            variants = [name]
+            plain = fold_text(name)
+            if plain != name:
+                variants.append(plain)
+            for variant in variants:
+                key = variant.casefold()
+                if key in kept:
+                    if variant is name:
+                        rejected["duplicate"] += 1
+                    continue
+                kept[key] = variant
+                if variant is not name:
+                    folded += 1
+                    if name in scores:
+                        scores[variant] = scores[name]
+        kept_names = set(kept.values())
+
+    report = {
+        "raw": len(names),
+        "kept": len(kept_names),
+        "shrink": round(1 - len(kept_names) / len(names), 4) if names else 0.0,
+        "stripped": stripped,
+        "folded_variants": folded,
+        "rejected": {"link": link_rejected, **rejected},
+    }
+    sample = load_hit_sample()
+    if sample:
+        with metrics.timed("hit_rate_sample"):
+            report["hit_rate_before"] = partial_hit_rate(names, sample)
+            report["hit_rate_after"] = partial_hit_rate(kept_names, sample)
+        report["hit_sample"] = len(sample)
+    if scores and NAME_AMBIGUITY_FILE:
+        save_ambiguity_scores({name: scores[name] for name in kept_names if name in scores})
+
+    for reason, count in rejected.items():
+        if count:
+            metrics.inc("names_rejected_total", count, reason=reason)
+    metrics.set_gauge("name_corpus_names", report["raw"], stage="raw")
+    metrics.set_gauge("name_corpus_names", report["kept"], stage="kept")
+    if "hit_rate_before" in report:
+        metrics.set_gauge("partial_hit_rate", report["hit_rate_before"], names="raw")
+        metrics.set_gauge("partial_hit_rate", report["hit_rate_after"], names="kept")
+    log_normalization_report(report)
+    return kept_names, report
+
+def save_ambiguity_scores(scores):
+    """Write {name: ambiguity score} for the kept names (temp file + rename)."""
+    tmp_path = NAME_AMBIGUITY_FILE + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(scores, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, NAME_AMBIGUITY_FILE)
+    except OSError as e:
+        print(f"[WARN] Could not write ambiguity scores: {e}")
+
+def log_normalization_report(report):
+    rejected = ", ".join(f"{count} {reason}" for reason, count in report["rejected"].items() if count)
+    print(f"[INFO] Name corpus: {report['raw']} -> {report['kept']} names "
+          f"({report['shrink']:.1%} smaller; rejected: {rejected or 'none'}; "
+          f"{report['stripped']} stripped, {report['folded_variants']} folded variants added).")
+    if not NAME_REFERENCE_CORPUS_FILE:
+        print("[INFO] Ambiguity scoring is off (set NAME_REFERENCE_CORPUS_FILE to enable it).")
+    if "hit_rate_before" in report:
+        print(f"[INFO] Partial-match hit rate on {report['hit_sample']} sample coins: "
+              f"{report['hit_rate_before']:.2%} -> {report['hit_rate_after']:.2%}.")
+
+def crawl_subpages(paths):
+    """
+    Fetch and parse sub-pages in parallel.
+    Returns {path: [names]} for the pages that were retrieved; pages that
+    still failed after all retries are left out.
+    """
+    results = {}
+    started = time.monotonic()
+    done = 0
+
+    def crawl_one(path):
+        html = fetch_page(BASE_WIKIPEDIA_URL + path)
+        return path, None if html is None else extract_names_from_html(html)
+
+    with ThreadPoolExecutor(max_workers=CRAWL_WORKERS) as pool:
+        crawl = metrics.bind_cycle(profiling.bind(crawl_one))
+        futures = [pool.submit(crawl, path) for path in paths]
+        for future in as_completed(futures):
+            path, names = future.result()
+            if names is not None:
+                results[path] = names
+                metrics.inc("pages_crawled_total")
+            done += 1
+            if done % CRAWL_PROGRESS_EVERY == 0 or done == len(futures):
+                rate = done / max(time.monotonic() - started, 1e-9)
+                print(f"[INFO] Crawled {done}/{len(futures)} pages ({rate:.1f} pages/s).")
+    return results
+
 def scrape_celebrity_names():
     """
     Scrape the main 'Lists_of_celebrities' page + sub-links to gather celebrity names.
     Returns a cleaned set of potential names.
     """
     sub_links = get_subpage_links()
+
+    # Optionally, filter out links that aren't "List_of_..." or skip irrelevant pages
+    # For example, you could do:
+    # sub_links = [link for link in sub_links if link.startswith("/wiki/List_of_")]
+
     all_celeb_names = set()
+    for names in crawl_subpages(sub_links).values():
+        all_celeb_names.update(names)
+    return normalize_name_corpus(all_celeb_names)[0]
 
-    for link in sub_links:
-        # Optionally, filter out links that aren't "List_of_..." or skip irrelevant pages
-        # For example, you could do:
-        # if not link.startswith("/wiki/List_of_"):
-        #     continue
+def refresh_celebrity_names(state, subpage_names):
+    """
+    Incremental rescrape driven by revision IDs.
+    Re-reads the sub-page list only when the main page changed, batch-queries
+    every sub-page's revision ID, and re-parses just the pages whose ID moved.
+    Updates state and subpage_names in place.
+    Returns the merged (not yet normalized) set of names, or None if
+    nothing changed.
+    """
+    main_revid = get_revision_ids([MAIN_PAGE_TITLE]).get(MAIN_PAGE_TITLE)
+    if main_revid is None:
+        print("[WARN] Could not retrieve current revision of the main page. Retrying later...")
+        return None
 
-        extracted = parse_list_page(link)
-        all_celeb_names.update(extracted)
-    
-    # Additional cleaning/deduping
-    cleaned_names = set()
-    for name in all_celeb_names:
-        # E.g., we only keep entries that have at least two words
-        # and are not excessively long
-        if len(name.split()) >= 2 and len(name) < 60:
-            cleaned_names.add(name)
-    
-    return cleaned_names
+    known = state["subpages"]
+    if main_revid != state["main_revid"] or not known:
+        print("[INFO] Main page changed (or first run). Re-reading sub-page list...")
+        links = get_subpage_links()
+        if not links:
+            return None
+    else:
+        links = list(known)
+
+    titles = {path: path_to_title(path) for path in links}
+    revids = get_revision_ids(set(titles.values()))
+    changed = [
+        path for path, title in titles.items()
+        if title in revids and known.get(path) != revids[title]
+    ]
+    removed = [path for path in subpage_names if path not in titles]
+    print(f"[INFO] {len(titles)} sub-pages: {len(changed)} changed, {len(removed)} removed.")
+
+    for path in removed:
+        del subpage_names[path]
+    crawled = crawl_subpages(changed)
+    subpage_names.update(crawled)
+
+    # Keep every linked page, but only record new revisions for pages we
+    # actually re-parsed: pages that failed (or whose revision lookup
+    # failed) keep their old revision, or None if they never parsed, and
+    # count as changed on the next run even if the main page doesn't move.
+    subpages = {}
+    for path, title in titles.items():
+        subpages[path] = revids[title] if path in crawled else known.get(path)
+    state["main_revid"] = main_revid
+    state["subpages"] = subpages
+
+    if not crawled and not removed:
+        return None
+
+    merged = set()
+    for names in subpage_names.values():
+        merged.update(names)
+    return merged
+
+def names_file_content(names):
+    """The exact bytes of the names file for this set (sorted, one per line)."""
+    return "".join(name + "\n" for name in sorted(names)).encode("utf-8")
 
 def save_celebrity_names_to_file(names):
     """
     Save the final set of celebrity names to 'CelebCoinSentry_celebrity_names.txt', one per line.
+    Written to a temp file, fsync'd and renamed over the old list, so a
+    running sentry never reloads a half-written file.
+    """
+    tmp_path = CELEBRITY_NAMES_FILE + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(names_file_content(names))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, CELEBRITY_NAMES_FILE)
+
+def save_matcher_cache_for_names(names):
+    """
+    Precompile the matcher for the names file about to be written, so the
+    sentry can mmap it (on startup or hot reload) instead of rebuilding.
+    Call before save_celebrity_names_to_file(): the cache is keyed by the
+    file's hash, so it is ready by the time the sentry sees the new file.
     """
-    with open(CELEBRITY_NAMES_FILE, "w", encoding="utf-8") as f:
-        for name in sorted(names):
-            f.write(name + "\n")
+    try:
+        digest = hashlib.sha256(names_file_content(names)).digest()
+        save_matcher_cache(build_matcher(names), CELEBRITY_MATCHER_CACHE_FILE, digest)
+    except OSError as e:
+        print(f"[WARN] Could not write matcher cache: {e}")
 
 # -----------------------------------------------------
 # Main Loop
 # -----------------------------------------------------
 
+def profile_sizes():
+    """Sizes of the scraper's in-memory data, for profile reports."""
+    return {"reference_corpus_words": len(_REFERENCE_CORPUS["counts"])}
+
+def run_scrape():
+    """
+    One update check: refresh from Wikipedia and, if anything changed, save
+    the matcher cache and the names file.
+    Returns a summary dict ('changed', 'names', the normalization report as
+    'corpus', duration and stage timings).
+    Captured with the profiler when triggered (see PROFILE_SIGNAL).
+    """
+    return profiling.profiled_call("scraper", _run_scrape, PROFILE_TRIGGER_FILE, profile_sizes)
+
+def _run_scrape():
+    print("[INFO] Checking Wikipedia for updates...")
+    started = time.perf_counter()
+    metrics.begin_cycle()
+    state = load_revision_state()
+    subpage_names = load_subpage_names()
+    link_rejected = metrics.counter_value("names_rejected_total", reason="link")
+    celeb_names = refresh_celebrity_names(state, subpage_names)
+    corpus = None
+
+    if celeb_names is not None:
+        link_rejected = metrics.counter_value("names_rejected_total", reason="link") - link_rejected
+        celeb_names, corpus = normalize_name_corpus(celeb_names, link_rejected)
+
+    if celeb_names is None:
+        print("[INFO] No changes detected. Using existing data.")
+    else:
+        save_subpage_names(subpage_names)
+        save_matcher_cache_for_names(celeb_names)
+        save_celebrity_names_to_file(celeb_names)
+        print(f"[INFO] Scraped and saved {len(celeb_names)} names.")
+        metrics.set_gauge("scraped_names", len(celeb_names))
+    save_revision_state(state)
+    metrics.inc("scrapes_total")
+    return {
+        "changed": celeb_names is not None,
+        "names": None if celeb_names is None else len(celeb_names),
+        "corpus": corpus,
+        "seconds": round(time.perf_counter() - started, 6),
+        "stages": metrics.end_cycle(),
+    }
+
+def log_scrape_summary(summary):
+    """Print one machine-readable JSON line describing the finished scrape."""
+    print(json.dumps({"event": "scrape", "ts": round(time.time(), 3), **summary}))
+
 def main():
     print(f"[INFO] {SCRIPT_NAME} v{VERSION} by {AUTHOR_NAME} started.")
+    metrics.start_metrics_server(METRICS_PORT, METRICS_HOST)
+    profiling.install_signal_trigger("scraper", PROFILE_SIGNAL)
 
     while True:
-        print("[INFO] Checking Wikipedia for updates...")
-
-        last_known_timestamp = load_last_revision()
-        current_timestamp = get_page_last_revision_timestamp(MAIN_PAGE_TITLE)
-
-        if current_timestamp is None:
-            print("[WARN] Could not retrieve current revision timestamp. Retrying later...")
-        else:
-            if last_known_timestamp is None:
-                print("[INFO] No previous timestamp found. Scraping now for the first time...")
-                celeb_names = scrape_celebrity_names()
-                save_celebrity_names_to_file(celeb_names)
-                save_last_revision(current_timestamp)
-                print(f"[INFO] Scraped and saved {len(celeb_names)} names.")
-            else:
-                # Compare current vs. last-known
-                if current_timestamp != last_known_timestamp:
-                    print("[INFO] Wikipedia page was updated! Scraping new data...")
-                    celeb_names = scrape_celebrity_names()
-                    save_celebrity_names_to_file(celeb_names)
-                    save_last_revision(current_timestamp)
-                    print(f"[INFO] Scraped and saved {len(celeb_names)} names.")
-                else:
-                    print("[INFO] No changes detected. Using existing data.")
-        
+        log_scrape_summary(run_scrape())
+
         print(f"[INFO] Sleeping for {SCRAPE_INTERVAL} seconds (~{SCRAPE_INTERVAL//3600} hours).")
         time.sleep(SCRAPE_INTERVAL)
 